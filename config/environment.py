@@ -31,6 +31,7 @@ class EnvironmentConfig:
     # API configurations
     api_timeout: int = 30
     api_retry_count: int = 3
+    api_http2: bool = False
     
     # Test data configurations
     test_data_cleanup: bool = True
@@ -177,6 +177,22 @@ def pytest_sessionfinish(session, exitstatus):
     logger.info("=" * 80)
 
 
+def pytest_collection_modifyitems(config, items):
+    """Pin skip_parallel tests to one xdist worker (honoured with --dist=loadgroup)"""
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    
+    for item in items:
+        if item.get_closest_marker("skip_parallel"):
+            item.add_marker(pytest.mark.xdist_group(name="serial"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Size '-n auto' to CPU count minus two, leaving headroom for browser processes"""
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook to capture test results and take screenshots on failure"""
@@ -260,13 +276,26 @@ def web_actions():
 @pytest.fixture(scope="function")
 def api_actions():
     """Provide APIActions instance for tests"""
-    return APIActions()
+    api_actions = APIActions()
+    yield api_actions
+    # Drop the instance's session and cookies; the shared pools are closed by shared_http_pools
+    api_actions.close_session()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_http_pools():
+    """Close the per-host connection pools shared by APIActions instances at session end"""
+    yield
+    APIActions.close_shared_adapters()
 
 
 @pytest.fixture(scope="function")
 def data_actions():
     """Provide DataActions instance for tests"""
-    return DataActions()
+    data_actions = DataActions()
+    yield data_actions
+    # Close CSV handles kept open by append_data_to_csv
+    data_actions.close_csv_appender()
 
 
 @pytest.fixture(scope="function")
@@ -313,8 +342,9 @@ def test_data_manager():
     """Provide test data manager with cleanup"""
     data_manager = DataActions()
     yield data_manager
-    # Cleanup cached data
+    # Cleanup cached data and open CSV append handles
     data_manager.clear_cache()
+    data_manager.close_csv_appender()
 
 
 # Markers for test categorization (registered in pytest.ini)
@@ -7,17 +7,28 @@ soft assertions, and warning assertions for comprehensive test validation.
 
 import logging
 import traceback
-from typing import Any, List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 import pytest
 
 
-class AssertionLevel(Enum):
+class AssertionLevel(IntEnum):
     """Assertion severity levels"""
-    HARD = "HARD"      # Critical - test fails immediately
-    SOFT = "SOFT"      # Collected - test fails at end if any soft assertions fail
-    WARNING = "WARNING" # Non-critical - logged but doesn't fail test
+    HARD = 1      # Critical - test fails immediately
+    SOFT = 2      # Collected - test fails at end if any soft assertions fail
+    WARNING = 3   # Non-critical - logged but doesn't fail test
+    
+    @classmethod
+    def _missing_(cls, value):
+        # Levels used to be the strings "HARD"/"SOFT"/"WARNING"; accept them by name
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+# Assertion messages may be passed as zero-argument callables, built only when needed
+Message = Union[str, Callable[[], str]]
 
 
 @dataclass
@@ -25,11 +36,18 @@ class AssertionResult:
     """Result of an assertion operation"""
     level: AssertionLevel
     passed: bool
-    message: str
+    _message: Message  # deferred messages are built on first read of .message
     expected: Any = None
     actual: Any = None
     exception: Optional[Exception] = None
     traceback_info: Optional[str] = None
+    
+    @property
+    def message(self) -> str:
+        """Assertion message, built once from a deferred callable if needed"""
+        if callable(self._message):
+            self._message = self._message()
+        return self._message
 
 
 @dataclass
@@ -75,7 +93,7 @@ class AssertionManager:
         self._test_context = test_name
         self.logger.debug(f"Set test context: {test_name}")
     
-    def hard_assert(self, condition: bool, message: str, expected: Any = None, actual: Any = None):
+    def hard_assert(self, condition: bool, message: Message, expected: Any = None, actual: Any = None):
         """
         Hard assertion - fails immediately if condition is False
         Use for critical functionality that must work
@@ -83,7 +101,7 @@ class AssertionManager:
         result = AssertionResult(
             level=AssertionLevel.HARD,
             passed=condition,
-            message=message,
+            _message=message,
             expected=expected,
             actual=actual
         )
@@ -91,13 +109,14 @@ class AssertionManager:
         self.results.append(result)
         
         if condition:
-            self.logger.info(f"✓ HARD ASSERT PASSED: {message}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"✓ HARD ASSERT PASSED: {result.message}")
         else:
             error_msg = self._format_error_message(result)
             self.logger.error(f"✗ HARD ASSERT FAILED: {error_msg}")
             pytest.fail(error_msg)
     
-    def soft_assert(self, condition: bool, message: str, expected: Any = None, actual: Any = None):
+    def soft_assert(self, condition: bool, message: Message, expected: Any = None, actual: Any = None):
         """
         Soft assertion - collects failures but doesn't stop test execution
         Use for UI validations or multiple related checks
@@ -105,7 +124,7 @@ class AssertionManager:
         result = AssertionResult(
             level=AssertionLevel.SOFT,
             passed=condition,
-            message=message,
+            _message=message,
             expected=expected,
             actual=actual
         )
@@ -116,12 +135,13 @@ class AssertionManager:
         self.results.append(result)
         
         if condition:
-            self.logger.info(f"✓ SOFT ASSERT PASSED: {message}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"✓ SOFT ASSERT PASSED: {result.message}")
         else:
             error_msg = self._format_error_message(result)
             self.logger.warning(f"✗ SOFT ASSERT FAILED: {error_msg}")
     
-    def warning_assert(self, condition: bool, message: str, expected: Any = None, actual: Any = None):
+    def warning_assert(self, condition: bool, message: Message, expected: Any = None, actual: Any = None):
         """
         Warning assertion - logs failure but doesn't affect test result
         Use for performance checks or non-critical features
@@ -129,7 +149,7 @@ class AssertionManager:
         result = AssertionResult(
             level=AssertionLevel.WARNING,
             passed=condition,
-            message=message,
+            _message=message,
             expected=expected,
             actual=actual
         )
@@ -137,15 +157,17 @@ class AssertionManager:
         self.results.append(result)
         
         if condition:
-            self.logger.info(f"✓ WARNING ASSERT PASSED: {message}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"✓ WARNING ASSERT PASSED: {result.message}")
         else:
             error_msg = self._format_error_message(result)
             self.logger.warning(f"⚠ WARNING ASSERT FAILED: {error_msg}")
     
-    def assert_equals(self, actual: Any, expected: Any, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_equals(self, actual: Any, expected: Any, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that two values are equal"""
+        level = AssertionLevel(level)
         if message is None:
-            message = f"Expected {expected}, but got {actual}"
+            message = lambda: f"Expected {expected}, but got {actual}"
         
         condition = actual == expected
         
@@ -156,10 +178,11 @@ class AssertionManager:
         else:
             self.warning_assert(condition, message, expected, actual)
     
-    def assert_not_equals(self, actual: Any, expected: Any, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_not_equals(self, actual: Any, expected: Any, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that two values are not equal"""
+        level = AssertionLevel(level)
         if message is None:
-            message = f"Expected {actual} to not equal {expected}"
+            message = lambda: f"Expected {actual} to not equal {expected}"
         
         condition = actual != expected
         
@@ -170,10 +193,11 @@ class AssertionManager:
         else:
             self.warning_assert(condition, message, f"!= {expected}", actual)
     
-    def assert_contains(self, container: Any, item: Any, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_contains(self, container: Any, item: Any, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that container contains item"""
+        level = AssertionLevel(level)
         if message is None:
-            message = f"Expected {container} to contain {item}"
+            message = lambda: f"Expected {container} to contain {item}"
         
         try:
             condition = item in container
@@ -187,10 +211,11 @@ class AssertionManager:
         else:
             self.warning_assert(condition, message, f"contains {item}", container)
     
-    def assert_true(self, condition: bool, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_true(self, condition: bool, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that condition is True"""
+        level = AssertionLevel(level)
         if message is None:
-            message = f"Expected condition to be True, but was {condition}"
+            message = lambda: f"Expected condition to be True, but was {condition}"
         
         if level == AssertionLevel.HARD:
             self.hard_assert(condition, message, True, condition)
@@ -199,10 +224,11 @@ class AssertionManager:
         else:
             self.warning_assert(condition, message, True, condition)
     
-    def assert_false(self, condition: bool, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_false(self, condition: bool, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that condition is False"""
+        level = AssertionLevel(level)
         if message is None:
-            message = f"Expected condition to be False, but was {condition}"
+            message = lambda: f"Expected condition to be False, but was {condition}"
         
         is_false = not condition
         
@@ -213,10 +239,11 @@ class AssertionManager:
         else:
             self.warning_assert(is_false, message, False, condition)
     
-    def assert_greater_than(self, actual: Any, expected: Any, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_greater_than(self, actual: Any, expected: Any, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that actual is greater than expected"""
+        level = AssertionLevel(level)
         if message is None:
-            message = f"Expected {actual} to be greater than {expected}"
+            message = lambda: f"Expected {actual} to be greater than {expected}"
         
         condition = actual > expected
         
@@ -227,10 +254,11 @@ class AssertionManager:
         else:
             self.warning_assert(condition, message, f"> {expected}", actual)
     
-    def assert_less_than(self, actual: Any, expected: Any, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_less_than(self, actual: Any, expected: Any, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that actual is less than expected"""
+        level = AssertionLevel(level)
         if message is None:
-            message = f"Expected {actual} to be less than {expected}"
+            message = lambda: f"Expected {actual} to be less than {expected}"
         
         condition = actual < expected
         
@@ -241,12 +269,13 @@ class AssertionManager:
         else:
             self.warning_assert(condition, message, f"< {expected}", actual)
     
-    def assert_length(self, container: Any, expected_length: int, message: str = None, level: AssertionLevel = AssertionLevel.HARD):
+    def assert_length(self, container: Any, expected_length: int, message: Message = None, level: AssertionLevel = AssertionLevel.HARD):
         """Assert that container has expected length"""
+        level = AssertionLevel(level)
         try:
             actual_length = len(container)
             if message is None:
-                message = f"Expected length {expected_length}, but got {actual_length}"
+                message = lambda: f"Expected length {expected_length}, but got {actual_length}"
             
             condition = actual_length == expected_length
             
@@ -3,10 +3,16 @@ Base Page Object Model for PyTestSuite Pro
 
 This module provides the base page class with common functionality
 for all page objects including element interactions, waits, and utilities.
+
+Page objects hold only per-instance state and are bound to one driver; for
+parallel runs (pytest-xdist or threads) give each worker thread its own driver,
+as DriverManager does, and never share a driver or its page objects across threads.
 """
 
 import time
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Optional, List, Tuple, Any, Union
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
@@ -25,9 +31,48 @@ from .assertions import assertion_manager
 from config import get_current_config
 
 
+# Whitespace-collapsed textContent: unlike innerText (what WebElement.text reads) it needs no layout pass
+_TEXT_OF_JS = """
+const textOf = el => el.textContent.replace(/\\s+/g, ' ').trim();
+"""
+
+# Text of every item_selector match inside each container match (or of the containers
+# themselves), optionally only rendered/visible ones, in one round trip
+_COLLECT_TEXTS_SCRIPT = _TEXT_OF_JS + """
+const [containerSelector, itemSelector, visibleOnly] = arguments;
+const visible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+const texts = [];
+for (const container of document.querySelectorAll(containerSelector)) {
+    const items = itemSelector ? container.querySelectorAll(itemSelector) : [container];
+    for (const item of items) {
+        if (!visibleOnly || visible(item)) texts.push(textOf(item));
+    }
+}
+return texts;
+"""
+
+# Presence, visibility of the first match and match count for each CSS selector, in one round trip
+_PROBE_SCRIPT = """
+return arguments[0].map(selector => {
+    const matches = document.querySelectorAll(selector);
+    const el = matches[0];
+    return {
+        present: matches.length > 0,
+        visible: !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden',
+        count: matches.length
+    };
+});
+"""
+
+
 class BasePage:
     """Base Page Object Model class with common page functionality"""
     
+    # Page-specific properties (override in subclasses); immutable, so safe to share between instances
+    page_url = ""
+    page_title = ""
+    page_load_element = None
+    
     def __init__(self, driver: WebDriver = None):
         self.driver = driver or get_driver()
         self.config = get_current_config()
@@ -35,10 +80,54 @@ class BasePage:
         self.wait = WebDriverWait(self.driver, self.config.timeout)
         self.actions = ActionChains(self.driver)
         
-        # Page-specific properties (override in subclasses)
-        self.page_url = ""
-        self.page_title = ""
-        self.page_load_element = None
+        # Driver's implicit wait in seconds, read once so negative probes can switch it off
+        self._implicit_wait = None
+    
+    @classmethod
+    def for_driver(cls, driver: WebDriver = None) -> 'BasePage':
+        """Return the shared instance of this page for the driver, creating it on first use"""
+        driver = driver or get_driver()
+        
+        # Page objects are not thread-safe; fail fast instead of letting parallel tests interleave
+        owner = getattr(driver, '_pts_owner_thread', None)
+        if owner is None:
+            owner = driver._pts_owner_thread = threading.get_ident()
+        elif owner != threading.get_ident():
+            raise RuntimeError(
+                "WebDriver is already used by another thread; create one driver per thread (see get_driver)"
+            )
+        
+        # Kept on the driver so the instances go away with it; a registry would keep the
+        # driver alive, since every page object references it
+        instances = getattr(driver, '_pts_page_objects', None)
+        if instances is None:
+            instances = driver._pts_page_objects = {}
+        
+        page = instances.get(cls)
+        if page is None:
+            page = instances[cls] = cls(driver)
+        return page
+    
+    @contextmanager
+    def no_implicit_wait(self):
+        """
+        Switch the driver's implicit wait off around presence probes that may miss
+        
+        Otherwise every lookup of an absent element blocks for the full implicit timeout. The
+        previous value is restored afterwards; a no-op when no implicit wait is configured.
+        """
+        if self._implicit_wait is None:
+            self._implicit_wait = self.driver.timeouts.implicit_wait
+        
+        if not self._implicit_wait:
+            yield
+            return
+        
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self._implicit_wait)
     
     def _setup_logger(self) -> logging.Logger:
         """Set up logging for page object"""
@@ -266,6 +355,23 @@ class BasePage:
         self.logger.debug(f"Got text from element {locator}: '{text}'")
         return text
     
+    def _safe_text(self, locator: Tuple[str, str], default: str = "") -> str:
+        """Get element text with a single lookup, or default when the element is not on the page"""
+        try:
+            with self.no_implicit_wait():
+                return self.driver.find_element(*locator).text
+        except NoSuchElementException:
+            return default
+    
+    def _collect_texts(self, locator: Tuple[str, str], item_selector: str = None,
+                       visible_only: bool = False) -> List[str]:
+        """Get the texts of all matches (or of their item_selector descendants) with one script call; CSS locators only"""
+        return self.driver.execute_script(_COLLECT_TEXTS_SCRIPT, locator[1], item_selector, visible_only)
+    
+    def _probe(self, *locators: Tuple[str, str]) -> List[dict]:
+        """Get {present, visible, count} for each CSS locator with one script call"""
+        return self.driver.execute_script(_PROBE_SCRIPT, [locator[1] for locator in locators])
+    
     def get_attribute(self, locator: Tuple[str, str], attribute_name: str) -> Optional[str]:
         """Get attribute value from element"""
         element = self.find_element(locator)
@@ -318,23 +424,23 @@ class BasePage:
     def get_all_options(self, locator: Tuple[str, str]) -> List[str]:
         """Get all option texts from dropdown"""
         element = self.find_element(locator)
-        select = Select(element)
-        return [option.text for option in select.options]
+        # One script call instead of a findElements plus a getText per option
+        return self.driver.execute_script("return Array.from(arguments[0].options, option => option.text);", element)
     
     # Wait methods
-    def wait_for_element_visible(self, locator: Tuple[str, str], timeout: int = None) -> bool:
-        """Wait for element to be visible"""
+    def wait_for_element_visible(self, locator: Tuple[str, str], timeout: int = None) -> Optional[WebElement]:
+        """Wait for element to be visible; returns the element, or None on timeout"""
         timeout = timeout or self.config.timeout
         
         try:
-            WebDriverWait(self.driver, timeout).until(
+            element = WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             self.logger.debug(f"Element became visible: {locator}")
-            return True
+            return element
         except TimeoutException:
             self.logger.debug(f"Element not visible within {timeout}s: {locator}")
-            return False
+            return None
     
     def wait_for_element_invisible(self, locator: Tuple[str, str], timeout: int = None) -> bool:
         """Wait for element to be invisible"""
@@ -107,19 +107,19 @@ class DriverManager:
             options = browser_config.get_chrome_options(browser_caps)
             driver_path = os.path.join(driver_dir, 'chromedriver.exe')
             service = ChromeService(executable_path=driver_path)
-            return webdriver.Chrome(service=service, options=options)
+            return webdriver.Chrome(service=service, options=options, keep_alive=True)
 
         elif self.browser_name == 'firefox':
             options = browser_config.get_firefox_options(browser_caps)
             driver_path = os.path.join(driver_dir, 'geckodriver.exe')
             service = FirefoxService(executable_path=driver_path)
-            return webdriver.Firefox(service=service, options=options)
+            return webdriver.Firefox(service=service, options=options, keep_alive=True)
 
         elif self.browser_name == 'edge':
             options = browser_config.get_edge_options(browser_caps)
             driver_path = os.path.join(driver_dir, 'msedgedriver.exe')
             service = EdgeService(executable_path=driver_path)
-            return webdriver.Edge(service=service, options=options)
+            return webdriver.Edge(service=service, options=options, keep_alive=True)
 
         else:
             raise ValueError(f"Unsupported browser: {self.browser_name}")
@@ -132,7 +132,8 @@ class DriverManager:
         try:
             return webdriver.Remote(
                 command_executor=self.remote_url,
-                desired_capabilities=capabilities
+                desired_capabilities=capabilities,
+                keep_alive=True  # reuse one pooled connection for every WebDriver command
             )
         except Exception as e:
             self.logger.error(f"Failed to connect to remote WebDriver: {str(e)}")
@@ -7,32 +7,127 @@ with support for different HTTP methods, authentication, and validation.
 
 import json
 import logging
+import threading
 import time
+import functools
 from typing import Dict, Any, Optional, List, Union
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+from requests.structures import CaseInsensitiveDict
 from requests_oauthlib import OAuth1
+from urllib3.util.request import ACCEPT_ENCODING
 
+from core import assertion_manager
 from config import get_current_config
 
 
+@functools.lru_cache(maxsize=4096)
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Join normalized base URL and endpoint (cached per base/endpoint pair)"""
+    if endpoint.startswith(('http://', 'https://')):
+        return endpoint
+    
+    return f"{base_url}/{endpoint.lstrip('/')}"
+
+
+# Marker for JSON paths that do not resolve
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_json_path(json_path: str) -> tuple:
+    """Split simplified dot-notation JSON path into accessors (cached per path)"""
+    return tuple(int(key) if key.isdigit() else key for key in json_path.split('.'))
+
+
+def _walk_json_path(data: Any, accessors: tuple) -> Any:
+    """Resolve accessors against JSON data, returning _MISSING instead of raising"""
+    for accessor in accessors:
+        if isinstance(data, dict):
+            data = data.get(accessor, _MISSING)
+            if data is _MISSING:
+                return _MISSING
+        elif isinstance(data, list) and isinstance(accessor, int) and accessor < len(data):
+            data = data[accessor]
+        else:
+            return _MISSING
+    return data
+
+
+class HTTPXResponse:
+    """Adapter exposing the requests.Response interface for httpx responses"""
+    
+    def __init__(self, response):
+        self._response = response
+    
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+    
+    @property
+    def reason(self) -> str:
+        return self._response.reason_phrase
+    
+    @property
+    def ok(self) -> bool:
+        return self._response.status_code < 400
+    
+    @property
+    def text(self) -> str:
+        return self._response.text
+    
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+    
+    @property
+    def headers(self):
+        return self._response.headers
+    
+    @property
+    def elapsed(self):
+        return self._response.elapsed
+    
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+    
+    def json(self, **kwargs) -> Any:
+        return self._response.json(**kwargs)
+    
+    def __bool__(self) -> bool:
+        # Mirror requests.Response truthiness
+        return self.ok
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+
 class APIActions:
     """High-level API action keywords for test automation"""
     
+    # Connection pools shared by all instances per API host, so connections stay warm;
+    # each instance keeps its own session so cookies never leak between instances
+    _shared_adapters: Dict[str, HTTPAdapter] = {}
+    _session_lock = threading.Lock()
+    
     def __init__(self):
         self.config = get_current_config()
-        self.session = requests.Session()
         self.logger = self._setup_logger()
-        self.base_url = self.config.api_base_url
+        self.base_url = self.config.api_base_url.rstrip('/')
         self.default_timeout = self.config.api_timeout
         self.last_response = None
+        self._session: Optional[requests.Session] = None
         
-        # Set default headers
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'User-Agent': 'PyTestSuite-Pro/1.0'
-        })
+        # Per-instance headers and auth, merged into each request so they never
+        # leak between instances sharing a session (None removes a session default)
+        self.headers = CaseInsensitiveDict()
+        self.auth = None
+        
+        # Optional HTTP/2 backend (multiplexes requests over one connection per host)
+        self._client = self._create_http2_client() if self.config.api_http2 else None
     
     def _setup_logger(self) -> logging.Logger:
         """Set up logging for API actions"""
@@ -47,6 +142,118 @@ class APIActions:
             logger.setLevel(logging.INFO)
         return logger
     
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """Create HTTP session with framework default headers"""
+        session = requests.Session()
+        # No default Content-Type: json= bodies set it per request, form/raw bodies keep their own
+        session.headers.update({
+            'Accept': 'application/json',
+            'User-Agent': 'PyTestSuite-Pro/1.0',
+            # Includes 'br' when brotli/brotlicffi is installed and urllib3 can decode it
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        return session
+    
+    @classmethod
+    def close_shared_adapters(cls):
+        """Close all shared connection pools (called by the shared_http_pools fixture at session end)"""
+        with cls._session_lock:
+            for adapter in cls._shared_adapters.values():
+                adapter.close()
+            cls._shared_adapters.clear()
+    
+    def _mount_shared_adapter(self, session: requests.Session):
+        """Route requests for the base URL's host through the pool shared by all instances"""
+        parts = urlsplit(self.base_url)
+        prefix = f"{parts.scheme}://{parts.netloc}/"
+        with APIActions._session_lock:
+            adapter = APIActions._shared_adapters.get(prefix)
+            if adapter is None:
+                adapter = APIActions._shared_adapters[prefix] = HTTPAdapter()
+        session.mount(prefix, adapter)
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session of this instance, using the connection pool shared per host"""
+        if self._session is None:
+            session = self._create_session()
+            self._mount_shared_adapter(session)
+            self._session = session
+        return self._session
+    
+    def _merge_headers(self, headers: Optional[Dict]) -> Optional[Dict]:
+        """Merge per-instance headers with per-request headers"""
+        if not self.headers:
+            return headers
+        
+        merged = CaseInsensitiveDict(self.headers)
+        if headers:
+            merged.update(headers)
+        return merged
+    
+    def _create_http2_client(self):
+        """Create HTTP/2 client (requires httpx with the http2 extra)"""
+        import httpx
+        
+        self.logger.info("Using HTTP/2 client for API requests")
+        return httpx.Client(
+            http2=True,
+            timeout=self.default_timeout,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+    
+    def _send(self, method: str, url: str, params: Dict = None, data: Union[Dict, str] = None,
+              json_data: Dict = None, headers: Dict = None, timeout: int = None, stream: bool = False):
+        """Send request through the active HTTP backend"""
+        headers = self._merge_headers(headers)
+        
+        if self._client is None:
+            return self.session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json_data,
+                headers=headers,
+                auth=self.auth,
+                timeout=timeout,
+                stream=stream
+            )
+        
+        import httpx
+        
+        # Session defaults plus instance/request headers, mirroring requests' merge
+        request_headers = CaseInsensitiveDict(self.session.headers)
+        if headers:
+            request_headers.update(headers)
+        request_headers = {key: value for key, value in request_headers.items() if value is not None}
+        
+        auth = self.auth
+        if isinstance(auth, HTTPBasicAuth):
+            auth = (auth.username, auth.password)
+        elif auth is not None:
+            raise ValueError("Only basic authentication is supported with the HTTP/2 client")
+        
+        raw_body = isinstance(data, (str, bytes))
+        
+        try:
+            request = self._client.build_request(
+                method,
+                url,
+                params=params,
+                data=None if raw_body else data,
+                content=data if raw_body else None,
+                json=json_data,
+                headers=request_headers,
+                timeout=timeout
+            )
+            response = self._client.send(request, auth=auth, stream=stream)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(str(e)) from e
+        
+        return HTTPXResponse(response)
+    
     # Configuration Methods
     def set_base_url(self, base_url: str):
         """
@@ -56,6 +263,8 @@ class APIActions:
             base_url: Base URL for API endpoints
         """
         self.base_url = base_url.rstrip('/')
+        if self._session is not None:
+            self._mount_shared_adapter(self._session)
         self.logger.info(f"API base URL set to: {self.base_url}")
     
     def set_timeout(self, timeout: int):
@@ -76,7 +285,7 @@ class APIActions:
             key: Header name
             value: Header value
         """
-        self.session.headers[key] = value
+        self.headers[key] = value
         self.logger.info(f"Header set: {key} = {value}")
     
     def remove_header(self, key: str):
@@ -86,8 +295,9 @@ class APIActions:
         Args:
             key: Header name to remove
         """
-        if key in self.session.headers:
-            del self.session.headers[key]
+        if self.headers.get(key) is not None or key in self.session.headers:
+            # None masks the shared session default for this instance only
+            self.headers[key] = None
             self.logger.info(f"Header removed: {key}")
     
     def set_auth_token(self, token: str, token_type: str = 'Bearer'):
@@ -98,7 +308,7 @@ class APIActions:
             token: Authentication token
             token_type: Type of token (Bearer, Token, etc.)
         """
-        self.session.headers['Authorization'] = f"{token_type} {token}"
+        self.headers['Authorization'] = f"{token_type} {token}"
         self.logger.info(f"Authentication token set: {token_type}")
     
     def set_basic_auth(self, username: str, password: str):
@@ -109,18 +319,53 @@ class APIActions:
             username: Username for basic auth
             password: Password for basic auth
         """
-        self.session.auth = HTTPBasicAuth(username, password)
+        self.auth = HTTPBasicAuth(username, password)
         self.logger.info(f"Basic authentication set for user: {username}")
     
     def clear_auth(self):
         """Clear all authentication"""
-        self.session.auth = None
-        if 'Authorization' in self.session.headers:
-            del self.session.headers['Authorization']
+        self.auth = None
+        self.headers.pop('Authorization', None)
         self.logger.info("Authentication cleared")
     
     # HTTP Method Keywords
-    def get_request(self, endpoint: str, params: Dict = None, headers: Dict = None, timeout: int = None) -> requests.Response:
+    def _do_request(self, method: str, endpoint: str, params: Dict = None, data: Union[Dict, str] = None,
+                    json_data: Dict = None, headers: Dict = None, timeout: int = None,
+                    discard_body: bool = False) -> requests.Response:
+        """Send request for any HTTP method with shared URL, timeout, logging and error handling"""
+        url = self._build_url(endpoint)
+        timeout = timeout or self.default_timeout
+        started = time.perf_counter()
+        
+        try:
+            response = self._send(
+                method,
+                url,
+                params=params,
+                data=data,
+                json_data=json_data,
+                headers=headers,
+                timeout=timeout,
+                stream=discard_body
+            )
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"{method} request failed: {str(e)}")
+            raise
+        
+        if discard_body:
+            # Status line and headers are already parsed; release without reading the body
+            response.close()
+            response._pts_body_discarded = True
+        
+        # Monotonic wall-clock time as seen by the test, read back by get_response_time
+        response._pts_elapsed = time.perf_counter() - started
+        
+        self.last_response = response
+        self._emit_request_log(method, url, params, json_data, response, response._pts_elapsed)
+        return response
+    
+    def get_request(self, endpoint: str, params: Dict = None, headers: Dict = None, timeout: int = None,
+                    discard_body: bool = False) -> requests.Response:
         """
         Send GET request
         
@@ -129,34 +374,16 @@ class APIActions:
             params: Query parameters
             headers: Additional headers
             timeout: Request timeout
+            discard_body: Close response without reading body (status-only checks)
             
         Returns:
             requests.Response: Response object
         """
-        url = self._build_url(endpoint)
-        timeout = timeout or self.default_timeout
-        
-        self.logger.info(f"Sending GET request to: {url}")
-        if params:
-            self.logger.info(f"Query parameters: {params}")
-        
-        try:
-            self.last_response = self.session.get(
-                url, 
-                params=params, 
-                headers=headers, 
-                timeout=timeout
-            )
-            
-            self._log_response(self.last_response)
-            return self.last_response
-            
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"GET request failed: {str(e)}")
-            raise
+        return self._do_request('GET', endpoint, params=params, headers=headers, timeout=timeout,
+                                discard_body=discard_body)
     
     def post_request(self, endpoint: str, data: Union[Dict, str] = None, json_data: Dict = None, 
-                     headers: Dict = None, timeout: int = None) -> requests.Response:
+                     headers: Dict = None, timeout: int = None, discard_body: bool = False) -> requests.Response:
         """
         Send POST request
         
@@ -166,35 +393,17 @@ class APIActions:
             json_data: JSON data
             headers: Additional headers
             timeout: Request timeout
+            discard_body: Close response without reading body (status-only checks)
             
         Returns:
             requests.Response: Response object
         """
-        url = self._build_url(endpoint)
-        timeout = timeout or self.default_timeout
-        
-        self.logger.info(f"Sending POST request to: {url}")
-        if json_data:
-            self.logger.info(f"JSON payload: {json.dumps(json_data, indent=2)}")
-        
-        try:
-            self.last_response = self.session.post(
-                url,
-                data=data,
-                json=json_data,
-                headers=headers,
-                timeout=timeout
-            )
-            
-            self._log_response(self.last_response)
-            return self.last_response
-            
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"POST request failed: {str(e)}")
-            raise
+        return self._do_request('POST', endpoint, data=data, json_data=json_data,
+                                headers=headers, timeout=timeout,
+                                discard_body=discard_body)
     
     def put_request(self, endpoint: str, data: Union[Dict, str] = None, json_data: Dict = None,
-                    headers: Dict = None, timeout: int = None) -> requests.Response:
+                    headers: Dict = None, timeout: int = None, discard_body: bool = False) -> requests.Response:
         """
         Send PUT request
         
@@ -204,35 +413,17 @@ class APIActions:
             json_data: JSON data
             headers: Additional headers
             timeout: Request timeout
+            discard_body: Close response without reading body (status-only checks)
             
         Returns:
             requests.Response: Response object
         """
-        url = self._build_url(endpoint)
-        timeout = timeout or self.default_timeout
-        
-        self.logger.info(f"Sending PUT request to: {url}")
-        if json_data:
-            self.logger.info(f"JSON payload: {json.dumps(json_data, indent=2)}")
-        
-        try:
-            self.last_response = self.session.put(
-                url,
-                data=data,
-                json=json_data,
-                headers=headers,
-                timeout=timeout
-            )
-            
-            self._log_response(self.last_response)
-            return self.last_response
-            
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"PUT request failed: {str(e)}")
-            raise
+        return self._do_request('PUT', endpoint, data=data, json_data=json_data,
+                                headers=headers, timeout=timeout,
+                                discard_body=discard_body)
     
     def patch_request(self, endpoint: str, data: Union[Dict, str] = None, json_data: Dict = None,
-                      headers: Dict = None, timeout: int = None) -> requests.Response:
+                      headers: Dict = None, timeout: int = None, discard_body: bool = False) -> requests.Response:
         """
         Send PATCH request
         
@@ -242,35 +433,17 @@ class APIActions:
             json_data: JSON data
             headers: Additional headers
             timeout: Request timeout
+            discard_body: Close response without reading body (status-only checks)
             
         Returns:
             requests.Response: Response object
         """
-        url = self._build_url(endpoint)
-        timeout = timeout or self.default_timeout
-        
-        self.logger.info(f"Sending PATCH request to: {url}")
-        if json_data:
-            self.logger.info(f"JSON payload: {json.dumps(json_data, indent=2)}")
-        
-        try:
-            self.last_response = self.session.patch(
-                url,
-                data=data,
-                json=json_data,
-                headers=headers,
-                timeout=timeout
-            )
-            
-            self._log_response(self.last_response)
-            return self.last_response
-            
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"PATCH request failed: {str(e)}")
-            raise
+        return self._do_request('PATCH', endpoint, data=data, json_data=json_data,
+                                headers=headers, timeout=timeout,
+                                discard_body=discard_body)
     
     def delete_request(self, endpoint: str, params: Dict = None, headers: Dict = None,
-                       timeout: int = None) -> requests.Response:
+                       timeout: int = None, discard_body: bool = False) -> requests.Response:
         """
         Send DELETE request
         
@@ -279,31 +452,72 @@ class APIActions:
             params: Query parameters
             headers: Additional headers
             timeout: Request timeout
+            discard_body: Close response without reading body (status-only checks)
             
         Returns:
             requests.Response: Response object
         """
-        url = self._build_url(endpoint)
-        timeout = timeout or self.default_timeout
+        return self._do_request('DELETE', endpoint, params=params, headers=headers, timeout=timeout,
+                                discard_body=discard_body)
+    
+    # Prepared Request Keywords
+    def prepare_template(self, method: str, endpoint: str, headers: Dict = None) -> requests.PreparedRequest:
+        """
+        Prepare reusable request template for endpoints called in tight loops
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            headers: Additional headers
+            
+        Returns:
+            requests.PreparedRequest: Prepared request template
+        """
+        template = self.session.prepare_request(
+            requests.Request(method.upper(), self._build_url(endpoint),
+                             headers=self._merge_headers(headers), auth=self.auth)
+        )
+        self.logger.info(f"Prepared {template.method} request template for: {template.url}")
+        return template
+    
+    def send_prepared(self, template: requests.PreparedRequest, params: Dict = None,
+                      json_data: Dict = None, timeout: int = None) -> requests.Response:
+        """
+        Send copy of prepared request template, skipping per-call session merging
+        
+        Args:
+            template: Template created by prepare_template
+            params: Query parameters
+            json_data: JSON data
+            timeout: Request timeout
+            
+        Returns:
+            requests.Response: Response object
+        """
+        request = template.copy()
         
-        self.logger.info(f"Sending DELETE request to: {url}")
         if params:
-            self.logger.info(f"Query parameters: {params}")
+            request.prepare_url(template.url, params)
+        
+        if json_data is not None:
+            body = json.dumps(json_data).encode('utf-8')
+            request.body = body
+            request.headers['Content-Length'] = str(len(body))
+            request.headers.setdefault('Content-Type', 'application/json')
+        
+        started = time.perf_counter()
         
         try:
-            self.last_response = self.session.delete(
-                url,
-                params=params,
-                headers=headers,
-                timeout=timeout
-            )
-            
-            self._log_response(self.last_response)
-            return self.last_response
-            
+            response = self.session.send(request, timeout=timeout or self.default_timeout)
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"DELETE request failed: {str(e)}")
+            self.logger.error(f"{request.method} request failed: {str(e)}")
             raise
+        
+        response._pts_elapsed = time.perf_counter() - started
+        
+        self.last_response = response
+        self._emit_request_log(request.method, request.url, params, json_data, response, response._pts_elapsed)
+        return response
     
     # Response Analysis Keywords
     def get_response_status_code(self, response: requests.Response = None) -> int:
@@ -338,8 +552,14 @@ class APIActions:
         if not response:
             raise ValueError("No response available")
         
+        # Decoded once per response; repeated value assertions reuse it
+        json_data = getattr(response, '_pts_json', _MISSING)
+        if json_data is not _MISSING:
+            return json_data
+        
         try:
             json_data = response.json()
+            response._pts_json = json_data
             self.logger.info("Response JSON data retrieved")
             return json_data
         except json.JSONDecodeError as e:
@@ -396,7 +616,9 @@ class APIActions:
         if not response:
             raise ValueError("No response available")
         
-        response_time = response.elapsed.total_seconds()
+        response_time = getattr(response, '_pts_elapsed', None)
+        if response_time is None:
+            response_time = response.elapsed.total_seconds()
         self.logger.info(f"Response time: {response_time}s")
         return response_time
     
@@ -421,11 +643,8 @@ class APIActions:
         # Simple JSONPath implementation for basic paths like "data.user.name"
         try:
             value = json_data
-            for key in json_path.split('.'):
-                if key.isdigit():
-                    value = value[int(key)]
-                else:
-                    value = value[key]
+            for key in _parse_json_path(json_path):
+                value = value[key]
             
             self.logger.info(f"JSON value at '{json_path}': {value}")
             return value
@@ -439,7 +658,7 @@ class APIActions:
         Check if JSON response contains specific key
         
         Args:
-            key: Key to check for
+            key: Key or JSONPath to check for (simplified dot notation)
             response: Response object (uses last response if None)
             
         Returns:
@@ -450,7 +669,7 @@ class APIActions:
             raise ValueError("No response available")
         
         json_data = self.get_response_json(response)
-        exists = key in json_data
+        exists = _walk_json_path(json_data, _parse_json_path(key)) is not _MISSING
         
         self.logger.info(f"JSON key '{key}' exists: {exists}")
         return exists
@@ -466,7 +685,6 @@ class APIActions:
         """
         actual_status = self.get_response_status_code(response)
         
-        from core import assertion_manager
         assertion_manager.assert_equals(
             actual_status,
             expected_status,
@@ -483,7 +701,6 @@ class APIActions:
         """
         response_text = self.get_response_text(response)
         
-        from core import assertion_manager
         assertion_manager.assert_contains(
             response_text,
             expected_text,
@@ -501,7 +718,6 @@ class APIActions:
         """
         actual_value = self.get_json_value(json_path, response)
         
-        from core import assertion_manager
         assertion_manager.assert_equals(
             actual_value,
             expected_value,
@@ -518,7 +734,6 @@ class APIActions:
         """
         response_time = self.get_response_time(response)
         
-        from core import assertion_manager
         assertion_manager.assert_less_than(
             response_time,
             max_seconds,
@@ -528,23 +743,35 @@ class APIActions:
     # Utility Methods
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint"""
-        if endpoint.startswith(('http://', 'https://')):
-            return endpoint
-        
-        endpoint = endpoint.lstrip('/')
-        return f"{self.base_url}/{endpoint}"
+        return _join_url(self.base_url, endpoint)
     
-    def _log_response(self, response: requests.Response):
-        """Log response details"""
-        self.logger.info(f"Response: {response.status_code} {response.reason}")
-        self.logger.info(f"Response time: {response.elapsed.total_seconds()}s")
+    def _emit_request_log(self, method: str, url: str, params: Optional[Dict],
+                          json_data: Optional[Dict], response: requests.Response, elapsed: float):
+        """Log request and response details as a single record"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        # Log response body for debugging (truncated)
-        if response.text:
+        message = f"{method} {url}"
+        if params:
+            message += f" params={params}"
+        if json_data:
+            message += f" payload={json.dumps(json_data)}"
+        message += f" -> {response.status_code} {response.reason} ({elapsed:.3f}s)"
+        
+        # Response body preview for debugging (truncated)
+        if (self.logger.isEnabledFor(logging.DEBUG) and not getattr(response, '_pts_body_discarded', False)
+                and response.text):
             text_preview = response.text[:500]
             if len(response.text) > 500:
                 text_preview += "... (truncated)"
-            self.logger.debug(f"Response body: {text_preview}")
+            message += f"\nResponse body: {text_preview}"
+        
+        self.logger.info(message, extra={
+            'http_method': method,
+            'http_url': url,
+            'http_status': response.status_code,
+            'http_elapsed': elapsed
+        })
     
     def save_response_to_file(self, filename: str, response: requests.Response = None):
         """
@@ -559,14 +786,24 @@ class APIActions:
             raise ValueError("No response available")
         
         import os
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(response.text)
+        # Write raw bytes to skip the decode/re-encode round trip of response.text
+        with open(filename, 'wb', buffering=64 * 1024) as f:
+            f.write(response.content)
         
         self.logger.info(f"Response saved to: {filename}")
     
     def close_session(self):
         """Close the HTTP session"""
-        self.session.close()
+        if self._session is not None:
+            self._session.cookies.clear()
+            # Shared pools stay open for other instances; closed by close_shared_adapters
+            shared = set(APIActions._shared_adapters.values())
+            for adapter in self._session.adapters.values():
+                if adapter not in shared:
+                    adapter.close()
+            self._session = None
+        if self._client is not None:
+            self._client.close()
         self.logger.info("API session closed")
\ No newline at end of file
@@ -5,35 +5,140 @@ This module provides high-level assertion keywords that combine
 web actions with assertion logic for comprehensive validations.
 """
 
+import functools
 import logging
+import threading
 from typing import Any, List, Dict, Optional, Union
-from selenium.webdriver.common.by import By
+import requests
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException
+)
 
 from core import assertion_manager, AssertionLevel
 from .web_actions import WebActions
 from .api_actions import APIActions
 
 
+def _find_substrings(text: str, needles: List[str]) -> set:
+    """Return the needles found in text, scanning it once with Aho-Corasick when pyahocorasick is installed"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return {needle for needle in needles if needle in text}
+    
+    # Empty needles always match; the automaton only takes non-empty words
+    remaining = {needle for needle in needles if needle}
+    if not remaining:
+        return set(needles)
+    
+    automaton = ahocorasick.Automaton()
+    for needle in remaining:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    
+    for _, needle in automaton.iter(text):
+        remaining.discard(needle)
+        if not remaining:
+            break
+    return set(needles) - remaining
+
+
+# Configured once at import; every AssertionKeywords instance shares it
+logger = logging.getLogger('AssertionKeywords')
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+
+# Infrastructure errors the get-then-assert keywords report as assertion failures
+_WEB_LOOKUP_ERRORS = (TimeoutException, NoSuchElementException, StaleElementReferenceException)
+_API_LOOKUP_ERRORS = (requests.RequestException, LookupError, TypeError, ValueError)
+
+
+# WebActions/APIActions pair shared by every AssertionKeywords instance on a thread
+_shared_actions = threading.local()
+
+
+class _LevelDispatch(dict):
+    """Level -> assertion callable table; levels that are not AssertionLevel members are coerced"""
+    
+    def __missing__(self, level):
+        # AssertionLevel(level) raises ValueError naming the bad level instead of a bare KeyError
+        return self[AssertionLevel(level)]
+
+
+# Level -> assertion callable tables, so keywords dispatch with one lookup
+_BOOL_DISPATCH = _LevelDispatch({
+    AssertionLevel.HARD: assertion_manager.hard_assert,
+    AssertionLevel.SOFT: assertion_manager.soft_assert,
+    AssertionLevel.WARNING: assertion_manager.warning_assert,
+})
+
+_EQ_DISPATCH = _LevelDispatch({
+    level: functools.partial(assertion_manager.assert_equals, level=level) for level in AssertionLevel
+})
+
+_CONTAINS_DISPATCH = _LevelDispatch({
+    level: functools.partial(assertion_manager.assert_contains, level=level) for level in AssertionLevel
+})
+
+_LT_DISPATCH = _LevelDispatch({
+    level: functools.partial(assertion_manager.assert_less_than, level=level) for level in AssertionLevel
+})
+
+
 class AssertionKeywords:
     """High-level assertion keywords combining actions with validations"""
     
+    # Login indicators; strategies are the raw strings behind selenium's By constants
+    _DASHBOARD_INDICATORS = (
+        ("css selector", ".dashboard"),
+        ("css selector", ".welcome"),
+        ("css selector", "[data-testid='dashboard']"),
+        ("css selector", ".user-menu"),
+        ("id", "dashboard")
+    )
+    _WELCOME_SELECTORS = (
+        ("css selector", ".welcome-message"),
+        ("css selector", ".user-name"),
+        ("css selector", "[data-testid='username']")
+    )
+    _LOGIN_PROBES = _DASHBOARD_INDICATORS + _WELCOME_SELECTORS
+    
     def __init__(self):
-        self.logger = self._setup_logger()
-        self.web_actions = WebActions()
-        self.api_actions = APIActions()
+        self.logger = logger
+        # A shared WebActions may still hold a driver quit by a previous test
+        web_actions = getattr(_shared_actions, 'web_actions', None)
+        if web_actions is not None:
+            web_actions.reset_driver()
+    
+    @property
+    def web_actions(self) -> WebActions:
+        """WebActions shared by all AssertionKeywords instances on this thread"""
+        web_actions = getattr(_shared_actions, 'web_actions', None)
+        if web_actions is None:
+            web_actions = _shared_actions.web_actions = WebActions()
+        return web_actions
     
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for assertion keywords"""
-        logger = logging.getLogger('AssertionKeywords')
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        return logger
+    @web_actions.setter
+    def web_actions(self, value: WebActions):
+        _shared_actions.web_actions = value
+    
+    @property
+    def api_actions(self) -> APIActions:
+        """APIActions shared by all AssertionKeywords instances on this thread"""
+        api_actions = getattr(_shared_actions, 'api_actions', None)
+        if api_actions is None:
+            api_actions = _shared_actions.api_actions = APIActions()
+        return api_actions
+    
+    @api_actions.setter
+    def api_actions(self, value: APIActions):
+        _shared_actions.api_actions = value
     
     # Web Element Assertion Keywords
     def assert_element_text(self, locator: tuple, expected_text: str, 
@@ -47,31 +152,19 @@ class AssertionKeywords:
             level: Assertion level (HARD, SOFT, WARNING)
             timeout: Wait timeout in seconds
         """
-        self.logger.info(f"Asserting element text: {locator} = '{expected_text}'")
+        self.logger.info("Asserting element text: %s = '%s'", locator, expected_text)
         
         try:
             actual_text = self.web_actions.get_element_text(locator, timeout)
             
-            if level == AssertionLevel.HARD:
-                assertion_manager.assert_equals(actual_text, expected_text, 
-                                              f"Element text mismatch at {locator}")
-            elif level == AssertionLevel.SOFT:
-                assertion_manager.assert_equals(actual_text, expected_text, 
-                                              f"Element text mismatch at {locator}", level)
-            else:
-                assertion_manager.warning_assert(actual_text == expected_text, 
-                                                f"Element text mismatch at {locator}")
+            _EQ_DISPATCH[level](actual_text, expected_text,
+                                lambda: f"Element text mismatch at {locator}")
         
-        except Exception as e:
+        except _WEB_LOOKUP_ERRORS as e:
             error_msg = f"Failed to get element text for assertion: {str(e)}"
             self.logger.error(error_msg)
             
-            if level == AssertionLevel.HARD:
-                assertion_manager.hard_assert(False, error_msg)
-            elif level == AssertionLevel.SOFT:
-                assertion_manager.soft_assert(False, error_msg)
-            else:
-                assertion_manager.warning_assert(False, error_msg)
+            _BOOL_DISPATCH[level](False, error_msg)
     
     def assert_element_visible(self, locator: tuple, 
                               level: AssertionLevel = AssertionLevel.HARD, timeout: int = 10):
@@ -83,16 +176,11 @@ class AssertionKeywords:
             level: Assertion level (HARD, SOFT, WARNING)
             timeout: Wait timeout in seconds
         """
-        self.logger.info(f"Asserting element visible: {locator}")
+        self.logger.info("Asserting element visible: %s", locator)
         
-        is_visible = self.web_actions.wait_for_element_visible(locator, timeout)
+        is_visible = self.web_actions.wait_for_element_visible(locator, timeout) is not None
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.hard_assert(is_visible, f"Element should be visible: {locator}")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.soft_assert(is_visible, f"Element should be visible: {locator}")
-        else:
-            assertion_manager.warning_assert(is_visible, f"Element should be visible: {locator}")
+        _BOOL_DISPATCH[level](is_visible, f"Element should be visible: {locator}")
     
     def assert_element_not_visible(self, locator: tuple, 
                                   level: AssertionLevel = AssertionLevel.HARD, timeout: int = 10):
@@ -104,16 +192,11 @@ class AssertionKeywords:
             level: Assertion level (HARD, SOFT, WARNING)
             timeout: Wait timeout in seconds
         """
-        self.logger.info(f"Asserting element not visible: {locator}")
+        self.logger.info("Asserting element not visible: %s", locator)
         
         is_invisible = self.web_actions.wait_for_element_invisible(locator, timeout)
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.hard_assert(is_invisible, f"Element should not be visible: {locator}")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.soft_assert(is_invisible, f"Element should not be visible: {locator}")
-        else:
-            assertion_manager.warning_assert(is_invisible, f"Element should not be visible: {locator}")
+        _BOOL_DISPATCH[level](is_invisible, f"Element should not be visible: {locator}")
     
     def assert_element_present(self, locator: tuple, 
                               level: AssertionLevel = AssertionLevel.HARD):
@@ -124,16 +207,11 @@ class AssertionKeywords:
             locator: Element locator tuple
             level: Assertion level (HARD, SOFT, WARNING)
         """
-        self.logger.info(f"Asserting element present: {locator}")
+        self.logger.info("Asserting element present: %s", locator)
         
         is_present = self.web_actions.is_element_present(locator)
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.hard_assert(is_present, f"Element should be present: {locator}")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.soft_assert(is_present, f"Element should be present: {locator}")
-        else:
-            assertion_manager.warning_assert(is_present, f"Element should be present: {locator}")
+        _BOOL_DISPATCH[level](is_present, f"Element should be present: {locator}")
     
     def assert_element_attribute(self, locator: tuple, attribute: str, expected_value: str,
                                 level: AssertionLevel = AssertionLevel.HARD, timeout: int = 10):
@@ -147,31 +225,19 @@ class AssertionKeywords:
             level: Assertion level (HARD, SOFT, WARNING)
             timeout: Wait timeout in seconds
         """
-        self.logger.info(f"Asserting element attribute: {locator}[{attribute}] = '{expected_value}'")
+        self.logger.info("Asserting element attribute: %s[%s] = '%s'", locator, attribute, expected_value)
         
         try:
             actual_value = self.web_actions.get_element_attribute(locator, attribute, timeout)
             
-            if level == AssertionLevel.HARD:
-                assertion_manager.assert_equals(actual_value, expected_value,
-                                              f"Element attribute '{attribute}' mismatch at {locator}")
-            elif level == AssertionLevel.SOFT:
-                assertion_manager.assert_equals(actual_value, expected_value,
-                                              f"Element attribute '{attribute}' mismatch at {locator}", level)
-            else:
-                assertion_manager.warning_assert(actual_value == expected_value,
-                                                f"Element attribute '{attribute}' mismatch at {locator}")
+            _EQ_DISPATCH[level](actual_value, expected_value,
+                                lambda: f"Element attribute '{attribute}' mismatch at {locator}")
         
-        except Exception as e:
+        except _WEB_LOOKUP_ERRORS as e:
             error_msg = f"Failed to get element attribute for assertion: {str(e)}"
             self.logger.error(error_msg)
             
-            if level == AssertionLevel.HARD:
-                assertion_manager.hard_assert(False, error_msg)
-            elif level == AssertionLevel.SOFT:
-                assertion_manager.soft_assert(False, error_msg)
-            else:
-                assertion_manager.warning_assert(False, error_msg)
+            _BOOL_DISPATCH[level](False, error_msg)
     
     # Page-level Assertion Keywords
     def assert_page_title(self, expected_title: str, 
@@ -183,16 +249,11 @@ class AssertionKeywords:
             expected_title: Expected page title
             level: Assertion level (HARD, SOFT, WARNING)
         """
-        self.logger.info(f"Asserting page title: '{expected_title}'")
+        self.logger.info("Asserting page title: '%s'", expected_title)
         
         actual_title = self.web_actions.get_page_title()
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.assert_equals(actual_title, expected_title, "Page title mismatch")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.assert_equals(actual_title, expected_title, "Page title mismatch", level)
-        else:
-            assertion_manager.warning_assert(actual_title == expected_title, "Page title mismatch")
+        _EQ_DISPATCH[level](actual_title, expected_title, "Page title mismatch")
     
     def assert_page_url_contains(self, expected_url_part: str,
                                 level: AssertionLevel = AssertionLevel.HARD):
@@ -203,19 +264,12 @@ class AssertionKeywords:
             expected_url_part: Expected URL substring
             level: Assertion level (HARD, SOFT, WARNING)
         """
-        self.logger.info(f"Asserting URL contains: '{expected_url_part}'")
+        self.logger.info("Asserting URL contains: '%s'", expected_url_part)
         
         current_url = self.web_actions.get_current_url()
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.assert_contains(current_url, expected_url_part, 
-                                            f"URL should contain '{expected_url_part}'")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.assert_contains(current_url, expected_url_part,
-                                            f"URL should contain '{expected_url_part}'", level)
-        else:
-            assertion_manager.warning_assert(expected_url_part in current_url,
-                                           f"URL should contain '{expected_url_part}'")
+        _CONTAINS_DISPATCH[level](current_url, expected_url_part,
+                                  lambda: f"URL should contain '{expected_url_part}'")
     
     def assert_page_loaded_successfully(self, level: AssertionLevel = AssertionLevel.HARD):
         """
@@ -226,26 +280,19 @@ class AssertionKeywords:
         """
         self.logger.info("Asserting page loaded successfully")
         
-        # Check that page title is not empty
-        title = self.web_actions.get_page_title()
-        title_check = bool(title.strip())
-        
-        # Check that URL is valid
+        # Cheapest checks first, stopping at the first failure
         url = self.web_actions.get_current_url()
-        url_check = url.startswith(('http://', 'https://'))
+        overall_success = url.startswith(('http://', 'https://'))
         
-        # Check that page source is not empty
-        page_source = self.web_actions.get_page_source()
-        source_check = len(page_source) > 100  # Basic check for substantial content
+        if overall_success:
+            title = self.web_actions.get_page_title()
+            overall_success = bool(title.strip())
         
-        overall_success = title_check and url_check and source_check
+        if overall_success:
+            # Basic check for substantial content, measured in the browser
+            overall_success = self.web_actions.get_page_source_length() > 100
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.hard_assert(overall_success, "Page should load successfully")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.soft_assert(overall_success, "Page should load successfully")
-        else:
-            assertion_manager.warning_assert(overall_success, "Page should load successfully")
+        _BOOL_DISPATCH[level](overall_success, "Page should load successfully")
     
     # API Assertion Keywords
     def assert_api_status_code(self, expected_status: int, response=None,
@@ -258,19 +305,12 @@ class AssertionKeywords:
             response: Response object (uses last response if None)
             level: Assertion level (HARD, SOFT, WARNING)
         """
-        self.logger.info(f"Asserting API status code: {expected_status}")
+        self.logger.info("Asserting API status code: %s", expected_status)
         
         actual_status = self.api_actions.get_response_status_code(response)
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.assert_equals(actual_status, expected_status, 
-                                          f"API status code should be {expected_status}")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.assert_equals(actual_status, expected_status,
-                                          f"API status code should be {expected_status}", level)
-        else:
-            assertion_manager.warning_assert(actual_status == expected_status,
-                                           f"API status code should be {expected_status}")
+        _EQ_DISPATCH[level](actual_status, expected_status,
+                            lambda: f"API status code should be {expected_status}")
     
     def assert_api_response_contains(self, expected_text: str, response=None,
                                     level: AssertionLevel = AssertionLevel.HARD):
@@ -282,19 +322,31 @@ class AssertionKeywords:
             response: Response object (uses last response if None)
             level: Assertion level (HARD, SOFT, WARNING)
         """
-        self.logger.info(f"Asserting API response contains: '{expected_text}'")
+        self.logger.info("Asserting API response contains: '%s'", expected_text)
+        
+        response_text = self.api_actions.get_response_text(response)
+        
+        _CONTAINS_DISPATCH[level](response_text, expected_text,
+                                  lambda: f"API response should contain '{expected_text}'")
+    
+    def assert_api_response_contains_all(self, expected_texts: List[str], response=None,
+                                        level: AssertionLevel = AssertionLevel.HARD):
+        """
+        Assert API response contains every expected text, scanning the body once
+        
+        Args:
+            expected_texts: Texts expected in response
+            response: Response object (uses last response if None)
+            level: Assertion level (HARD, SOFT, WARNING)
+        """
+        self.logger.info("Asserting API response contains %d texts", len(expected_texts))
         
         response_text = self.api_actions.get_response_text(response)
+        found = _find_substrings(response_text, expected_texts)
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.assert_contains(response_text, expected_text,
-                                            f"API response should contain '{expected_text}'")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.assert_contains(response_text, expected_text,
-                                            f"API response should contain '{expected_text}'", level)
-        else:
-            assertion_manager.warning_assert(expected_text in response_text,
-                                           f"API response should contain '{expected_text}'")
+        for expected_text in expected_texts:
+            _BOOL_DISPATCH[level](expected_text in found,
+                                  f"API response should contain '{expected_text}'")
     
     def assert_api_json_value(self, json_path: str, expected_value: Any, response=None,
                              level: AssertionLevel = AssertionLevel.HARD):
@@ -307,31 +359,19 @@ class AssertionKeywords:
             response: Response object (uses last response if None)
             level: Assertion level (HARD, SOFT, WARNING)
         """
-        self.logger.info(f"Asserting API JSON value: {json_path} = {expected_value}")
+        self.logger.info("Asserting API JSON value: %s = %s", json_path, expected_value)
         
         try:
             actual_value = self.api_actions.get_json_value(json_path, response)
             
-            if level == AssertionLevel.HARD:
-                assertion_manager.assert_equals(actual_value, expected_value,
-                                              f"JSON value at '{json_path}' should be {expected_value}")
-            elif level == AssertionLevel.SOFT:
-                assertion_manager.assert_equals(actual_value, expected_value,
-                                              f"JSON value at '{json_path}' should be {expected_value}", level)
-            else:
-                assertion_manager.warning_assert(actual_value == expected_value,
-                                               f"JSON value at '{json_path}' should be {expected_value}")
+            _EQ_DISPATCH[level](actual_value, expected_value,
+                                lambda: f"JSON value at '{json_path}' should be {expected_value}")
         
-        except Exception as e:
+        except _API_LOOKUP_ERRORS as e:
             error_msg = f"Failed to get JSON value for assertion: {str(e)}"
             self.logger.error(error_msg)
             
-            if level == AssertionLevel.HARD:
-                assertion_manager.hard_assert(False, error_msg)
-            elif level == AssertionLevel.SOFT:
-                assertion_manager.soft_assert(False, error_msg)
-            else:
-                assertion_manager.warning_assert(False, error_msg)
+            _BOOL_DISPATCH[level](False, error_msg)
     
     def assert_api_response_time_under(self, max_seconds: float, response=None,
                                       level: AssertionLevel = AssertionLevel.WARNING):
@@ -343,19 +383,12 @@ class AssertionKeywords:
             response: Response object (uses last response if None)
             level: Assertion level (usually WARNING for performance)
         """
-        self.logger.info(f"Asserting API response time under: {max_seconds}s")
+        self.logger.info("Asserting API response time under: %ss", max_seconds)
         
         response_time = self.api_actions.get_response_time(response)
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.assert_less_than(response_time, max_seconds,
-                                             f"API response time should be under {max_seconds}s")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.assert_less_than(response_time, max_seconds,
-                                             f"API response time should be under {max_seconds}s", level)
-        else:
-            assertion_manager.warning_assert(response_time < max_seconds,
-                                           f"API response time should be under {max_seconds}s")
+        _LT_DISPATCH[level](response_time, max_seconds,
+                            lambda: f"API response time should be under {max_seconds}s")
     
     # Composite Assertion Keywords
     def assert_login_successful(self, expected_username: str = None,
@@ -373,51 +406,26 @@ class AssertionKeywords:
         current_url = self.web_actions.get_current_url()
         url_check = "login" not in current_url.lower()
         
-        # Check for dashboard or welcome elements
-        dashboard_indicators = [
-            (By.CSS_SELECTOR, ".dashboard"),
-            (By.CSS_SELECTOR, ".welcome"),
-            (By.CSS_SELECTOR, "[data-testid='dashboard']"),
-            (By.CSS_SELECTOR, ".user-menu"),
-            (By.ID, "dashboard")
-        ]
-        
-        dashboard_present = any(self.web_actions.is_element_present(locator) 
-                              for locator in dashboard_indicators)
+        # Check for dashboard or welcome elements (probed together in one script call)
+        probes = self.web_actions.batch_query(self._LOGIN_PROBES)
+        dashboard_present = any(probe['present'] for probe in probes[:len(self._DASHBOARD_INDICATORS)])
         
         login_success = url_check and dashboard_present
         
-        if level == AssertionLevel.HARD:
-            assertion_manager.hard_assert(login_success, "Login should be successful")
-        elif level == AssertionLevel.SOFT:
-            assertion_manager.soft_assert(login_success, "Login should be successful")
-        else:
-            assertion_manager.warning_assert(login_success, "Login should be successful")
+        _BOOL_DISPATCH[level](login_success, "Login should be successful")
         
         # Additional username check if provided
         if expected_username and login_success:
             try:
-                welcome_selectors = [
-                    (By.CSS_SELECTOR, ".welcome-message"),
-                    (By.CSS_SELECTOR, ".user-name"),
-                    (By.CSS_SELECTOR, "[data-testid='username']")
-                ]
-                
-                for selector in welcome_selectors:
-                    if self.web_actions.is_element_present(selector):
-                        element_text = self.web_actions.get_element_text(selector)
-                        if expected_username.lower() in element_text.lower():
-                            self.logger.info(f"Username verification successful: {expected_username}")
-                            break
+                expected_lower = expected_username.lower()
+                for probe in probes[len(self._DASHBOARD_INDICATORS):]:
+                    if probe['present'] and expected_lower in probe['text'].lower():
+                        self.logger.info("Username verification successful: %s", expected_username)
+                        break
                 else:
-                    if level == AssertionLevel.HARD:
-                        assertion_manager.hard_assert(False, f"Username '{expected_username}' not found after login")
-                    elif level == AssertionLevel.SOFT:
-                        assertion_manager.soft_assert(False, f"Username '{expected_username}' not found after login")
-                    else:
-                        assertion_manager.warning_assert(False, f"Username '{expected_username}' not found after login")
+                    _BOOL_DISPATCH[level](False, f"Username '{expected_username}' not found after login")
             except Exception as e:
-                self.logger.warning(f"Could not verify username after login: {str(e)}")
+                self.logger.warning("Could not verify username after login: %s", e)
     
     def assert_form_validation_errors(self, field_errors: Dict[tuple, str],
                                      level: AssertionLevel = AssertionLevel.SOFT):
@@ -430,31 +438,44 @@ class AssertionKeywords:
         """
         self.logger.info("Asserting form validation errors")
         
+        # One read of the page text rules out errors that are not shown anywhere; a match there
+        # only means the text is on the page, so passes are confirmed on the field's own error element
+        try:
+            page_text = self.web_actions.get_page_text()
+        except Exception as e:
+            self.logger.warning("Could not check validation errors: %s", e)
+            _BOOL_DISPATCH[level](False, f"Could not read page text to check validation errors: {e}")
+            return
+        
+        candidates = {}
         for field_locator, expected_error in field_errors.items():
+            if expected_error in page_text:
+                candidates[field_locator] = expected_error
+            else:
+                _BOOL_DISPATCH[level](False, f"Field {field_locator} should have error: {expected_error}")
+        
+        if not candidates:
+            return
+        
+        # Check the error elements next to the remaining fields in one script call
+        error_locators = [(by, f"{selector} + .error, {selector} .error") for by, selector in candidates]
+        try:
+            probes = self.web_actions.batch_query(error_locators)
+        except Exception as e:
+            self.logger.warning("Could not check validation errors: %s", e)
+            _BOOL_DISPATCH[level](False, f"Could not check validation errors: {e}")
+            return
+        
+        for (field_locator, expected_error), probe in zip(candidates.items(), probes):
             try:
-                # Check for error message near the field
-                error_locator = (field_locator[0], field_locator[1] + " + .error, " + field_locator[1] + " .error")
-                
-                if self.web_actions.is_element_present(error_locator):
-                    actual_error = self.web_actions.get_element_text(error_locator)
+                if probe['present']:
+                    actual_error = probe['text']
                     
-                    if level == AssertionLevel.HARD:
-                        assertion_manager.assert_contains(actual_error, expected_error,
-                                                        f"Field {field_locator} should have error: {expected_error}")
-                    elif level == AssertionLevel.SOFT:
-                        assertion_manager.assert_contains(actual_error, expected_error,
-                                                        f"Field {field_locator} should have error: {expected_error}", level)
-                    else:
-                        assertion_manager.warning_assert(expected_error in actual_error,
-                                                       f"Field {field_locator} should have error: {expected_error}")
+                    _CONTAINS_DISPATCH[level](actual_error, expected_error,
+                                              f"Field {field_locator} should have error: {expected_error}")
                 else:
                     error_msg = f"No validation error found for field: {field_locator}"
-                    if level == AssertionLevel.HARD:
-                        assertion_manager.hard_assert(False, error_msg)
-                    elif level == AssertionLevel.SOFT:
-                        assertion_manager.soft_assert(False, error_msg)
-                    else:
-                        assertion_manager.warning_assert(False, error_msg)
+                    _BOOL_DISPATCH[level](False, error_msg)
             
             except Exception as e:
-                self.logger.warning(f"Could not check validation error for {field_locator}: {str(e)}")
\ No newline at end of file
+                self.logger.warning("Could not check validation error for %s: %s", field_locator, e)
\ No newline at end of file
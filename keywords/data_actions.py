@@ -5,37 +5,211 @@ This module provides keywords for handling test data from various sources
 including JSON, CSV, YAML files and databases.
 """
 
+import functools
 import os
 import json
+import random
+import string
+import itertools
+import re
+import copy
 import csv
+import weakref
+from decimal import Decimal
 import yaml
 import logging
-from typing import Dict, List, Any, Optional, Union
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Callable, Dict, List, Any, Iterator, Optional, Tuple, Union
 import pandas as pd
 from faker import Faker
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# libyaml's C loader when PyYAML was built with it
+_YAMLSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# 1 MiB file buffer instead of io.DEFAULT_BUFFER_SIZE (8 KiB) to cut read()/write() syscalls on large data files
+_IO_BUFSIZE = 1 << 20
+
+# Upper bound on concurrent reads when loading many fixture files at once
+_MAX_READ_WORKERS = 16
+
+# Bulk generation above this many records fans out to worker processes
+_PARALLEL_GENERATION_THRESHOLD = 2000
+_MAX_GENERATION_WORKERS = 8
+
+# Default number of entries kept in DataActions.cached_data before the least recently used
+# one is evicted; PTS_CACHE_ENTRIES overrides it, read when each instance is created
+_CACHE_MAX_ENTRIES = 128
+
+try:
+    import orjson
+except ImportError:  # optional: pip install pytestsuite-pro[orjson]
+    orjson = None
+
+
+# Configured once at import; every DataActions instance shares it
+logger = logging.getLogger('DataActions')
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+
+class _LRUCache(MutableMapping):
+    """Dict-like cache that evicts the least recently used entry beyond maxsize"""
+    
+    def __init__(self, maxsize: int, on_evict: Optional[Callable[[str], None]] = None):
+        self.maxsize = maxsize
+        self._on_evict = on_evict
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            if self._on_evict is not None:
+                self._on_evict(evicted)
+    
+    def __delitem__(self, key: str):
+        del self._data[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    # views read the underlying dict so iterating them does not reorder entries
+    def items(self):
+        return self._data.items()
+    
+    def values(self):
+        return self._data.values()
+    
+    def clear(self):
+        self._data.clear()
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize Decimal values (e.g. native product prices) that json/orjson reject"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _generate_records_chunk(kind: str, count: int, seed: int, native_types: bool) -> List[Dict[str, Any]]:
+    """Worker-process entry point: build a seeded DataActions and generate one chunk of records"""
+    actions = DataActions()
+    actions.faker.seed_instance(seed)
+    if kind == 'user':
+        return actions._user_records(count)
+    return actions._product_records(count, native_types)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_json_snapshot(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a JSON file once per (path, mtime, size); a changed file gets a new cache key
+    
+    The returned object is shared by every caller, so copy it before handing it out.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _close_appenders(appenders: Dict[str, Tuple[IO, csv.DictWriter]]):
+    """Finalizer for DataActions: close append handles still open (holds no reference to the instance)"""
+    for f, _ in appenders.values():
+        f.close()
+    appenders.clear()
+
 
 class DataActions:
     """Data management keywords for test automation"""
     
+    _SPECIAL_CHARS = "!@#$%^&*"
+    _ALPHA = string.ascii_letters
+    _ALNUM = _ALPHA + string.digits
+    _ALPHA_SPECIAL = _ALPHA + _SPECIAL_CHARS
+    _ALNUM_SPECIAL = _ALNUM + _SPECIAL_CHARS
+    # generate_product_data fields that are stringified unless native_types=True
+    _PRODUCT_NATIVE_FIELDS = ('price', 'weight', 'in_stock', 'quantity')
+    
     def __init__(self):
-        self.logger = self._setup_logger()
+        self.logger = logger
         self.faker = Faker()
         self.test_data_dir = "test_data"
-        self.cached_data: Dict[str, Any] = {}
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for data actions"""
-        logger = logging.getLogger('DataActions')
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        return logger
+        self._data_dir = Path(self.test_data_dir)
+        self._json_dir = self._data_dir / "json"
+        self._csv_dir = self._data_dir / "csv"
+        self._yaml_dir = self._data_dir / "yaml"
+        # cache_key -> (cached row list, row count, {column: values}); columns are built on first filter
+        self.cached_data_columnar: Dict[str, Tuple[list, int, Dict[str, list]]] = {}
+        self.cached_data: MutableMapping = _LRUCache(int(os.getenv('PTS_CACHE_ENTRIES', _CACHE_MAX_ENTRIES)),
+                                                   on_evict=self._on_cache_evict)
+        # CSV path -> (open append handle, writer) kept alive across append_data_to_csv calls;
+        # closed by close_csv_appender, or when the instance is collected / the interpreter exits
+        self._csv_appenders: Dict[str, Tuple[IO, csv.DictWriter]] = {}
+        weakref.finalize(self, _close_appenders, self._csv_appenders)
+        self._faker_pools = self._build_faker_pools()
+    
+    def _build_faker_pools(self) -> Dict[str, tuple]:
+        """
+        Collect the static value lists behind Faker's list-backed providers
+        
+        Returns:
+            Dict[str, tuple]: Field name mapped to (values, weights) for bulk sampling
+        """
+        sources = {
+            'first_name': ('person', 'first_names'),
+            'last_name': ('person', 'last_names'),
+            'country': ('address', 'countries'),
+            'job_title': ('job', 'jobs'),
+            'color': ('color', 'all_colors'),
+            'category': ('lorem', 'word_list'),
+        }
+        providers = {}
+        for provider in self.faker.get_providers():
+            family = type(provider).__module__.split('.')[2:3]
+            if family:
+                providers.setdefault(family[0], provider)
+        
+        pools = {}
+        for field, (family, attribute) in sources.items():
+            values = getattr(providers.get(family), attribute, None)
+            if not values:
+                continue
+            if isinstance(values, dict):
+                weights = list(values.values()) if family == 'person' else None
+                pools[field] = (list(values.keys()), weights)
+            else:
+                pools[field] = (list(values), None)
+        return pools
+    
+    def _sample_column(self, field: str, count: int, fallback) -> List[Any]:
+        """Draw count values for field from its Faker pool, or call fallback per row"""
+        pool = self._faker_pools.get(field)
+        if pool is None:
+            return [fallback() for _ in range(count)]
+        values, weights = pool
+        return self.faker.random.choices(values, weights=weights, k=count)
     
     # File Loading Keywords
     def load_json_data(self, filename: str, cache_key: str = None) -> Dict[str, Any]:
@@ -49,57 +223,79 @@ class DataActions:
         Returns:
             Dict: JSON data
         """
-        file_path = os.path.join(self.test_data_dir, "json", filename)
+        file_path = self._json_dir / filename
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"JSON file not found: {file_path}")
+        try:
+            f = open(file_path, 'rb', buffering=_IO_BUFSIZE)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file not found: {file_path}") from None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             if cache_key:
                 self.cached_data[cache_key] = data
             
-            self.logger.info(f"JSON data loaded from: {filename}")
+            self.logger.info("JSON data loaded from: %s", filename)
             return data
             
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse JSON file {filename}: {str(e)}")
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+            self.logger.error("Failed to parse JSON file %s: %s", filename, e)
             raise
     
-    def load_csv_data(self, filename: str, cache_key: str = None) -> List[Dict[str, str]]:
+    def load_csv_data(self, filename: str, cache_key: str = None, as_dataframe: bool = False,
+                      chunk_size: int = None
+                      ) -> Union[List[Dict[str, str]], pd.DataFrame, Iterator[List[Dict[str, str]]]]:
         """
         Load data from CSV file
         
         Args:
             filename: CSV filename (relative to test_data directory)
             cache_key: Optional cache key to store data
+            as_dataframe: Return the parsed DataFrame for columnar access
+            chunk_size: Stream records in lists of this size instead of loading the whole file (not cached)
             
         Returns:
-            List[Dict]: CSV data as list of dictionaries
+            List[Dict], DataFrame or Iterator[List[Dict]]: CSV data as dictionaries (all values as strings)
         """
-        file_path = os.path.join(self.test_data_dir, "csv", filename)
+        file_path = self._csv_dir / filename
+        self._flush_csv_appender(file_path)
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"CSV file not found: {file_path}")
+        try:
+            f = open(file_path, 'rb', buffering=_IO_BUFSIZE)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {file_path}") from None
+        
+        if chunk_size:
+            self.logger.info("Streaming CSV data from: %s in chunks of %s", filename, chunk_size)
+            return self._iter_csv_chunks(f, chunk_size)
         
         try:
-            data = []
-            with open(file_path, 'r', encoding='utf-8') as f:
-                csv_reader = csv.DictReader(f)
-                data = list(csv_reader)
+            # pandas' C parser; dtype=str and no NA conversion keep csv.DictReader's string values
+            with f:
+                df = pd.read_csv(f, encoding='utf-8', engine='c', dtype=str,
+                                 keep_default_na=False, na_filter=False)
+            data = df if as_dataframe else df.to_dict('records')
             
             if cache_key:
                 self.cached_data[cache_key] = data
             
-            self.logger.info(f"CSV data loaded from: {filename} ({len(data)} rows)")
+            self.logger.info("CSV data loaded from: %s (%d rows)", filename, len(data))
             return data
             
         except Exception as e:
-            self.logger.error(f"Failed to load CSV file {filename}: {str(e)}")
+            self.logger.error("Failed to load CSV file %s: %s", filename, e)
             raise
     
+    def _iter_csv_chunks(self, f, chunk_size: int) -> Iterator[List[Dict[str, str]]]:
+        """Yield CSV records in lists of chunk_size from an open file, keeping only one chunk in memory"""
+        with f, pd.read_csv(f, encoding='utf-8', engine='c', dtype=str, keep_default_na=False,
+                            na_filter=False, chunksize=chunk_size) as reader:
+            for chunk in reader:
+                yield chunk.to_dict('records')
+    
     def load_yaml_data(self, filename: str, cache_key: str = None) -> Dict[str, Any]:
         """
         Load data from YAML file
@@ -111,26 +307,30 @@ class DataActions:
         Returns:
             Dict: YAML data
         """
-        file_path = os.path.join(self.test_data_dir, "yaml", filename)
+        file_path = self._yaml_dir / filename
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"YAML file not found: {file_path}")
+        try:
+            f = open(file_path, 'r', encoding='utf-8', buffering=_IO_BUFSIZE)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"YAML file not found: {file_path}") from None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            with f:
+                data = yaml.load(f, Loader=_YAMLSafeLoader)
             
             if cache_key:
                 self.cached_data[cache_key] = data
             
-            self.logger.info(f"YAML data loaded from: {filename}")
+            self.logger.info("YAML data loaded from: %s", filename)
             return data
             
         except yaml.YAMLError as e:
-            self.logger.error(f"Failed to parse YAML file {filename}: {str(e)}")
+            self.logger.error("Failed to parse YAML file %s: %s", filename, e)
             raise
     
-    def load_excel_data(self, filename: str, sheet_name: str = None, cache_key: str = None) -> List[Dict[str, Any]]:
+    def load_excel_data(self, filename: str, sheet_name: str = None, cache_key: str = None,
+                        use_pandas: bool = False,
+                        chunk_size: int = None) -> Union[List[Dict[str, Any]], Iterator[List[Dict[str, Any]]]]:
         """
         Load data from Excel file
         
@@ -138,30 +338,133 @@ class DataActions:
             filename: Excel filename (relative to test_data directory)
             sheet_name: Sheet name to load (first sheet if None)
             cache_key: Optional cache key to store data
+            use_pandas: Parse through pd.read_excel instead of streaming rows with openpyxl
+            chunk_size: Stream records in lists of this size instead of loading the whole sheet (not cached)
             
         Returns:
-            List[Dict]: Excel data as list of dictionaries
+            List[Dict] or Iterator[List[Dict]]: Excel data as dictionaries
         """
-        file_path = os.path.join(self.test_data_dir, filename)
+        file_path = self._data_dir / filename
         
-        if not os.path.exists(file_path):
+        if not file_path.is_file():
             raise FileNotFoundError(f"Excel file not found: {file_path}")
         
+        # openpyxl only reads the OOXML formats; legacy .xls goes through pandas
+        stream_rows = not use_pandas and file_path.suffix.lower() in ('.xlsx', '.xlsm')
+        
+        if chunk_size:
+            self.logger.info("Streaming Excel data from: %s in chunks of %s", filename, chunk_size)
+            if stream_rows:
+                return self._chunk_records(self._iter_excel_rows(file_path, sheet_name), chunk_size)
+            df = pd.read_excel(file_path, sheet_name=sheet_name if sheet_name is not None else 0)
+            return self._chunk_records(df.to_dict('records'), chunk_size)
+        
         try:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            data = df.to_dict('records')
+            if stream_rows:
+                data = list(self._iter_excel_rows(file_path, sheet_name))
+            else:
+                df = pd.read_excel(file_path, sheet_name=sheet_name if sheet_name is not None else 0)
+                data = df.to_dict('records')
             
             if cache_key:
                 self.cached_data[cache_key] = data
             
             sheet_info = f" (sheet: {sheet_name})" if sheet_name else ""
-            self.logger.info(f"Excel data loaded from: {filename}{sheet_info} ({len(data)} rows)")
+            self.logger.info("Excel data loaded from: %s%s (%d rows)", filename, sheet_info, len(data))
             return data
             
         except Exception as e:
-            self.logger.error(f"Failed to load Excel file {filename}: {str(e)}")
+            self.logger.error("Failed to load Excel file %s: %s", filename, e)
             raise
     
+    def _iter_excel_rows(self, file_path: Path, sheet_name: str = None) -> Iterator[Dict[str, Any]]:
+        """Stream sheet rows with openpyxl in read-only mode, without a DataFrame in between"""
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            rows = sheet.iter_rows(values_only=True)
+            headers = next(rows, None)
+            if headers is None:
+                return
+            for row in rows:
+                if any(cell is not None for cell in row):
+                    yield dict(zip(headers, row))
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _chunk_records(records, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Group an iterable of records into lists of chunk_size"""
+        records = iter(records)
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    # Bulk Loading Keywords
+    def load_json_many(self, filenames: List[str]) -> Dict[str, Any]:
+        """
+        Load several JSON files, reading them concurrently
+        
+        Args:
+            filenames: JSON filenames (relative to test_data/json)
+            
+        Returns:
+            Dict: Parsed JSON data keyed by filename
+        """
+        contents = self._read_many(self._json_dir, filenames, "JSON")
+        loads = orjson.loads if orjson is not None else json.loads
+        data = {filename: loads(raw) for filename, raw in contents.items()}
+        
+        self.logger.info("JSON data loaded from %d files", len(data))
+        return data
+    
+    def load_yaml_many(self, filenames: List[str]) -> Dict[str, Any]:
+        """
+        Load several YAML files, reading them concurrently
+        
+        Args:
+            filenames: YAML filenames (relative to test_data/yaml)
+            
+        Returns:
+            Dict: Parsed YAML data keyed by filename
+        """
+        contents = self._read_many(self._yaml_dir, filenames, "YAML")
+        data = {filename: yaml.load(raw, Loader=_YAMLSafeLoader) for filename, raw in contents.items()}
+        
+        self.logger.info("YAML data loaded from %d files", len(data))
+        return data
+    
+    def _read_many(self, base_dir: Path, filenames: List[str], kind: str) -> Dict[str, bytes]:
+        """
+        Read raw file contents with a thread pool so the blocking reads overlap
+        
+        Args:
+            base_dir: Directory the filenames are relative to
+            filenames: Files to read
+            kind: File type used in the not-found message
+            
+        Returns:
+            Dict[str, bytes]: File contents keyed by filename, in input order
+        """
+        def read(filename):
+            file_path = base_dir / filename
+            try:
+                with open(file_path, 'rb', buffering=_IO_BUFSIZE) as f:
+                    return f.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"{kind} file not found: {file_path}") from None
+        
+        filenames = list(filenames)
+        if len(filenames) < 2:
+            return {filename: read(filename) for filename in filenames}
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(filenames))) as executor:
+            return dict(zip(filenames, executor.map(read, filenames)))
+    
     # Cache Management Keywords
     def get_cached_data(self, cache_key: str) -> Any:
         """
@@ -187,7 +490,12 @@ class DataActions:
             data: Data to cache
         """
         self.cached_data[cache_key] = data
-        self.logger.info(f"Data cached with key: {cache_key}")
+        self.logger.info("Data cached with key: %s", cache_key)
+    
+    def _on_cache_evict(self, cache_key: str):
+        """Drop derived column data along with an evicted cache entry"""
+        self.cached_data_columnar.pop(cache_key, None)
+        self.logger.debug("Evicted least recently used cache entry: %s", cache_key)
     
     def clear_cache(self, cache_key: str = None):
         """
@@ -199,9 +507,11 @@ class DataActions:
         if cache_key:
             if cache_key in self.cached_data:
                 del self.cached_data[cache_key]
-                self.logger.info(f"Cleared cached data for key: {cache_key}")
+                self.cached_data_columnar.pop(cache_key, None)
+                self.logger.info("Cleared cached data for key: %s", cache_key)
         else:
             self.cached_data.clear()
+            self.cached_data_columnar.clear()
             self.logger.info("Cleared all cached data")
     
     # Data Generation Keywords
@@ -238,44 +548,122 @@ class DataActions:
             self.logger.info("Generated single user data")
             return user_data
         else:
-            users_data = [create_user() for _ in range(count)]
-            self.logger.info(f"Generated {count} user records")
+            users_data = self._generate_in_parallel('user', count) or self._user_records(count)
+            self.logger.info("Generated %d user records", count)
             return users_data
     
-    def generate_product_data(self, count: int = 1) -> Union[Dict[str, str], List[Dict[str, str]]]:
+    def generate_product_data(self, count: int = 1,
+                              native_types: bool = False) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Generate fake product data
         
         Args:
             count: Number of product records to generate
+            native_types: Keep price/weight/in_stock/quantity as Decimal/float/bool/int instead of strings
             
         Returns:
             Dict or List[Dict]: Generated product data
         """
         def create_product():
-            return {
+            product = {
                 'name': self.faker.catch_phrase(),
                 'description': self.faker.text(max_nb_chars=200),
-                'price': str(self.faker.pydecimal(left_digits=3, right_digits=2, positive=True)),
+                'price': self.faker.pydecimal(left_digits=3, right_digits=2, positive=True),
                 'category': self.faker.word(),
                 'sku': self.faker.ean13(),
                 'brand': self.faker.company(),
                 'color': self.faker.color_name(),
-                'weight': str(self.faker.pyfloat(left_digits=2, right_digits=2, positive=True)),
+                'weight': self.faker.pyfloat(left_digits=2, right_digits=2, positive=True),
                 'dimensions': f"{self.faker.pyfloat(1, 2, True)}x{self.faker.pyfloat(1, 2, True)}x{self.faker.pyfloat(1, 2, True)}",
-                'in_stock': str(self.faker.boolean()),
-                'quantity': str(self.faker.random_int(min=0, max=100))
+                'in_stock': self.faker.boolean(),
+                'quantity': self.faker.random_int(min=0, max=100)
             }
+            if not native_types:
+                for key in self._PRODUCT_NATIVE_FIELDS:
+                    product[key] = str(product[key])
+            return product
         
         if count == 1:
             product_data = create_product()
             self.logger.info("Generated single product data")
             return product_data
         else:
-            products_data = [create_product() for _ in range(count)]
-            self.logger.info(f"Generated {count} product records")
+            products_data = (self._generate_in_parallel('product', count, native_types)
+                             or self._product_records(count, native_types))
+            self.logger.info("Generated %d product records", count)
             return products_data
     
+    def _user_records(self, count: int) -> List[Dict[str, str]]:
+        """Build count user records column by column, sampling list-backed fields in bulk"""
+        return self._zip_columns({
+            'first_name': self._sample_column('first_name', count, self.faker.first_name),
+            'last_name': self._sample_column('last_name', count, self.faker.last_name),
+            'email': [self.faker.email() for _ in range(count)],
+            'username': [self.faker.user_name() for _ in range(count)],
+            'password': [self.faker.password(length=12) for _ in range(count)],
+            'phone': [self.faker.phone_number() for _ in range(count)],
+            'address': [self.faker.address() for _ in range(count)],
+            'city': [self.faker.city() for _ in range(count)],
+            'country': self._sample_column('country', count, self.faker.country),
+            'postal_code': [self.faker.postcode() for _ in range(count)],
+            'date_of_birth': [self.faker.date_of_birth().strftime('%Y-%m-%d') for _ in range(count)],
+            'company': [self.faker.company() for _ in range(count)],
+            'job_title': self._sample_column('job_title', count, self.faker.job),
+            'ssn': [self.faker.ssn() for _ in range(count)]
+        })
+    
+    def _product_records(self, count: int, native_types: bool = False) -> List[Dict[str, Any]]:
+        """Build count product records column by column, sampling list-backed fields in bulk"""
+        columns = {
+            'name': [self.faker.catch_phrase() for _ in range(count)],
+            'description': [self.faker.text(max_nb_chars=200) for _ in range(count)],
+            'price': [self.faker.pydecimal(left_digits=3, right_digits=2, positive=True) for _ in range(count)],
+            'category': self._sample_column('category', count, self.faker.word),
+            'sku': [self.faker.ean13() for _ in range(count)],
+            'brand': [self.faker.company() for _ in range(count)],
+            'color': self._sample_column('color', count, self.faker.color_name),
+            'weight': [self.faker.pyfloat(left_digits=2, right_digits=2, positive=True) for _ in range(count)],
+            'dimensions': [f"{self.faker.pyfloat(1, 2, True)}x{self.faker.pyfloat(1, 2, True)}x{self.faker.pyfloat(1, 2, True)}"
+                           for _ in range(count)],
+            'in_stock': [self.faker.boolean() for _ in range(count)],
+            'quantity': [self.faker.random_int(min=0, max=100) for _ in range(count)]
+        }
+        if not native_types:
+            for key in self._PRODUCT_NATIVE_FIELDS:
+                columns[key] = list(map(str, columns[key]))
+        return self._zip_columns(columns)
+    
+    def _generate_in_parallel(self, kind: str, count: int, native_types: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        Spread large record batches over worker processes, since Faker is GIL-bound Python code
+        
+        Args:
+            kind: 'user' or 'product'
+            count: Number of records to generate
+            native_types: Passed through to product generation
+            
+        Returns:
+            List[Dict] or None: Generated records, or None when the batch is too small or only one CPU is available
+        """
+        workers = min(os.cpu_count() or 1, _MAX_GENERATION_WORKERS)
+        if count <= _PARALLEL_GENERATION_THRESHOLD or workers < 2:
+            return None
+        
+        chunk, remainder = divmod(count, workers)
+        sizes = [chunk + (i < remainder) for i in range(workers)]
+        # seeds drawn from this instance keep Faker.seed()/seed_instance() runs reproducible
+        seeds = [self.faker.random.getrandbits(64) for _ in sizes]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_generate_records_chunk, [kind] * workers, sizes, seeds, [native_types] * workers)
+            return list(itertools.chain.from_iterable(chunks))
+    
+    @staticmethod
+    def _zip_columns(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """Turn column lists of equal length into a list of row dicts"""
+        keys = tuple(columns)
+        return [dict(zip(keys, row)) for row in zip(*columns.values())]
+    
     def generate_random_string(self, length: int = 10, include_numbers: bool = True, 
                               include_special: bool = False) -> str:
         """
@@ -289,17 +677,11 @@ class DataActions:
         Returns:
             str: Random string
         """
-        import string
-        import random
-        
-        chars = string.ascii_letters
-        if include_numbers:
-            chars += string.digits
-        if include_special:
-            chars += "!@#$%^&*"
+        pools = ((self._ALPHA, self._ALPHA_SPECIAL), (self._ALNUM, self._ALNUM_SPECIAL))
+        chars = pools[bool(include_numbers)][bool(include_special)]
         
-        random_string = ''.join(random.choice(chars) for _ in range(length))
-        self.logger.info(f"Generated random string of length {length}")
+        random_string = ''.join(random.choices(chars, k=length))
+        self.logger.info("Generated random string of length %d", length)
         return random_string
     
     def generate_random_email(self, domain: str = None) -> str:
@@ -318,26 +700,67 @@ class DataActions:
         else:
             email = self.faker.email()
         
-        self.logger.info(f"Generated random email: {email}")
+        self.logger.info("Generated random email: %s", email)
         return email
     
     # Data Manipulation Keywords
-    def filter_data(self, data: List[Dict], filter_key: str, filter_value: Any) -> List[Dict]:
+    def filter_data(self, data: Union[List[Dict], pd.DataFrame], filter_key: str, filter_value: Any) -> List[Dict]:
         """
         Filter list of dictionaries by key-value pair
         
         Args:
-            data: List of dictionaries to filter
+            data: List of dictionaries, or a DataFrame (e.g. load_csv_data(as_dataframe=True)), to filter
             filter_key: Key to filter by
             filter_value: Value to match
             
         Returns:
             List[Dict]: Filtered data
         """
-        filtered_data = [item for item in data if item.get(filter_key) == filter_value]
-        self.logger.info(f"Filtered data: {len(filtered_data)} items match {filter_key}={filter_value}")
+        if isinstance(data, pd.DataFrame):
+            # vectorized comparison on the column instead of a per-row dict lookup
+            filtered_data = data[data[filter_key] == filter_value].to_dict('records') if filter_key in data else []
+        else:
+            # building a NumPy column from row dicts costs more than this single pass saves
+            filtered_data = [item for item in data if item.get(filter_key) == filter_value]
+        self.logger.debug("Filtered data: %d items match %s=%s", len(filtered_data), filter_key, filter_value)
         return filtered_data
     
+    def filter_cached_data(self, cache_key: str, filter_key: str, filter_value: Any) -> List[Dict]:
+        """
+        Filter cached records by key-value pair using a column of that key's values
+        
+        Args:
+            cache_key: Cache key of a list of dictionaries (e.g. from load_csv_data)
+            filter_key: Key to filter by
+            filter_value: Value to match
+            
+        Returns:
+            List[Dict]: Filtered data
+        """
+        data = self.get_cached_data(cache_key)
+        if isinstance(data, pd.DataFrame):
+            return self.filter_data(data, filter_key, filter_value)
+        
+        column = self._cached_column(cache_key, data, filter_key)
+        filtered_data = list(itertools.compress(data, [value == filter_value for value in column]))
+        
+        self.logger.info("Filtered cached data '%s': %d items match %s=%s",
+                         cache_key, len(filtered_data), filter_key, filter_value)
+        return filtered_data
+    
+    def _cached_column(self, cache_key: str, data: List[Dict], column: str) -> list:
+        """Return the values of column across cached rows, building and storing it once per cache entry"""
+        entry = self.cached_data_columnar.get(cache_key)
+        if entry is None or entry[0] is not data or entry[1] != len(data):
+            # re-cached under a new object or rows added/removed; drop columns built from the old rows
+            entry = (data, len(data), {})
+            self.cached_data_columnar[cache_key] = entry
+        
+        columns = entry[2]
+        if column not in columns:
+            columns[column] = [row.get(column) for row in data]
+        return columns[column]
+    
     def get_data_by_index(self, data: List, index: int) -> Any:
         """
         Get data item by index
@@ -349,11 +772,12 @@ class DataActions:
         Returns:
             Any: Data item at index
         """
-        if index >= len(data):
-            raise IndexError(f"Index {index} out of range for data with {len(data)} items")
+        try:
+            item = data[index]
+        except IndexError:
+            raise IndexError(f"Index {index} out of range for data with {len(data)} items") from None
         
-        item = data[index]
-        self.logger.info(f"Retrieved data item at index {index}")
+        self.logger.debug("Retrieved data item at index %s", index)
         return item
     
     def get_random_data_item(self, data: List) -> Any:
@@ -366,15 +790,32 @@ class DataActions:
         Returns:
             Any: Random data item
         """
-        import random
-        
         if not data:
             raise ValueError("Cannot get random item from empty data list")
         
         item = random.choice(data)
-        self.logger.info("Retrieved random data item")
+        self.logger.debug("Retrieved random data item")
         return item
     
+    def get_random_data_items(self, data: List, k: int, unique: bool = False) -> List[Any]:
+        """
+        Get several random items from data list in one call
+        
+        Args:
+            data: List of data items
+            k: Number of items to pick
+            unique: Pick without replacement (k must not exceed len(data))
+            
+        Returns:
+            List[Any]: Random data items
+        """
+        if not data:
+            raise ValueError("Cannot get random items from empty data list")
+        
+        items = random.sample(data, k) if unique else random.choices(data, k=k)
+        self.logger.info("Retrieved %d random data items", len(items))
+        return items
+    
     def merge_data(self, *data_sources: Dict) -> Dict:
         """
         Merge multiple data dictionaries
@@ -386,12 +827,13 @@ class DataActions:
             Dict: Merged data dictionary
         """
         merged_data = {}
+        update = merged_data.update  # bound once; dict |= would need Python 3.9+
         
         for data in data_sources:
             if isinstance(data, dict):
-                merged_data.update(data)
+                update(data)
         
-        self.logger.info(f"Merged {len(data_sources)} data sources")
+        self.logger.info("Merged %d data sources", len(data_sources))
         return merged_data
     
     # Data Validation Keywords
@@ -409,7 +851,7 @@ class DataActions:
         missing_keys = [key for key in required_keys if key not in data]
         
         if missing_keys:
-            self.logger.error(f"Missing required keys: {missing_keys}")
+            self.logger.error("Missing required keys: %s", missing_keys)
             return False
         
         self.logger.info("Data structure validation passed")
@@ -425,14 +867,27 @@ class DataActions:
         Returns:
             bool: True if email format is valid
         """
-        import re
-        
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        is_valid = bool(re.match(email_pattern, email))
+        is_valid = _EMAIL_RE.match(email) is not None
         
-        self.logger.info(f"Email format validation for '{email}': {is_valid}")
+        self.logger.info("Email format validation for '%s': %s", email, is_valid)
         return is_valid
     
+    def validate_email_formats(self, emails: List[str]) -> List[bool]:
+        """
+        Validate format of many email addresses
+        
+        Args:
+            emails: Email addresses to validate
+            
+        Returns:
+            List[bool]: Validity of each email, in order
+        """
+        match = _EMAIL_RE.match
+        results = [match(email) is not None for email in emails]
+        
+        self.logger.info("Email format validation: %d/%d valid", sum(results), len(results))
+        return results
+    
     # Data Saving Keywords
     def save_data_to_json(self, data: Dict, filename: str):
         """
@@ -442,47 +897,85 @@ class DataActions:
             data: Data to save
             filename: JSON filename (relative to test_data directory)
         """
-        file_path = os.path.join(self.test_data_dir, "json", filename)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file_path = self._json_dir / filename
+        file_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(file_path, 'wb', buffering=_IO_BUFSIZE) as f:
+                    f.write(orjson.dumps(data, default=_json_default,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(file_path, 'w', encoding='utf-8', buffering=_IO_BUFSIZE) as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
             
-            self.logger.info(f"Data saved to JSON file: {filename}")
+            self.logger.info("Data saved to JSON file: %s", filename)
             
         except Exception as e:
-            self.logger.error(f"Failed to save JSON file {filename}: {str(e)}")
+            self.logger.error("Failed to save JSON file %s: %s", filename, e)
             raise
     
-    def save_data_to_csv(self, data: List[Dict], filename: str):
+    def save_data_to_csv(self, data: List[Dict], filename: str, use_stdlib: bool = False):
         """
         Save data to CSV file
         
         Args:
             data: List of dictionaries to save
             filename: CSV filename (relative to test_data directory)
+            use_stdlib: Always write with csv.DictWriter (stdlib dialect, quoting and value formatting)
+                instead of pyarrow's C writer when pyarrow is installed
         """
         if not data:
             raise ValueError("Cannot save empty data to CSV")
         
-        file_path = os.path.join(self.test_data_dir, "csv", filename)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file_path = self._csv_dir / filename
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # the file is about to be truncated; a still-open appender would write after stale offsets
+        self.close_csv_appender(filename)
         
         try:
-            fieldnames = data[0].keys()
+            fieldnames = list(data[0].keys())
             
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+            if use_stdlib or not self._write_csv_arrow(data, fieldnames, file_path):
+                with open(file_path, 'w', newline='', encoding='utf-8', buffering=_IO_BUFSIZE) as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(data)
             
-            self.logger.info(f"Data saved to CSV file: {filename} ({len(data)} rows)")
+            self.logger.info("Data saved to CSV file: %s (%d rows)", filename, len(data))
             
         except Exception as e:
-            self.logger.error(f"Failed to save CSV file {filename}: {str(e)}")
+            self.logger.error("Failed to save CSV file %s: %s", filename, e)
             raise
     
+    @staticmethod
+    def _write_csv_arrow(data: List[Dict], fieldnames: List[str], file_path: Path) -> bool:
+        """
+        Write records with pyarrow's C CSV writer
+        
+        Args:
+            data: List of dictionaries to save
+            fieldnames: Column order (taken from the first record)
+            file_path: Destination CSV file
+            
+        Returns:
+            bool: False if pyarrow is not installed or cannot type the columns, so the caller falls back
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:  # optional: pip install pytestsuite-pro[arrow]
+            return False
+        
+        try:
+            table = pa.Table.from_pylist(data).select(fieldnames)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, KeyError):
+            # mixed-type columns or keys missing from the first record
+            return False
+        
+        pacsv.write_csv(table, str(file_path), write_options=pacsv.WriteOptions(quoting_style='needed'))
+        return True
+    
     def append_data_to_csv(self, data: Dict, filename: str):
         """
         Append single data record to existing CSV file
@@ -491,25 +984,59 @@ class DataActions:
             data: Data dictionary to append
             filename: CSV filename (relative to test_data directory)
         """
-        file_path = os.path.join(self.test_data_dir, "csv", filename)
-        
-        file_exists = os.path.exists(file_path)
+        file_path = self._csv_dir / filename
         
         try:
-            with open(file_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=data.keys())
+            appender = self._csv_appenders.get(str(file_path))
+            if appender is None:
+                f = open(file_path, 'a', newline='', encoding='utf-8')
+                writer = csv.DictWriter(f, fieldnames=list(data.keys()))
                 
-                if not file_exists:
+                # append mode starts at end of file, so position 0 means a new/empty file; the
+                # header is flushed at once so another appender opening the file sees it
+                if f.tell() == 0:
                     writer.writeheader()
+                    f.flush()
                 
-                writer.writerow(data)
+                appender = self._csv_appenders[str(file_path)] = (f, writer)
             
-            self.logger.info(f"Data appended to CSV file: {filename}")
+            f, writer = appender
+            if list(data) != writer.fieldnames:
+                # each record is written in its own key order, as with a writer per call
+                writer = csv.DictWriter(f, fieldnames=list(data.keys()))
+                self._csv_appenders[str(file_path)] = (f, writer)
+            
+            # rows stay buffered until the file is read through load_csv_data or the appender is closed
+            writer.writerow(data)
+            self.logger.info("Data appended to CSV file: %s", filename)
             
         except Exception as e:
-            self.logger.error(f"Failed to append to CSV file {filename}: {str(e)}")
+            self.logger.error("Failed to append to CSV file %s: %s", filename, e)
             raise
     
+    def close_csv_appender(self, filename: str = None):
+        """
+        Flush and close the handle kept open by append_data_to_csv
+        
+        Args:
+            filename: CSV filename (relative to test_data directory); closes all appenders if None
+        """
+        if filename is None:
+            paths = list(self._csv_appenders)
+        else:
+            paths = [str(self._csv_dir / filename)]
+        
+        for path in paths:
+            appender = self._csv_appenders.pop(path, None)
+            if appender is not None:
+                appender[0].close()
+    
+    def _flush_csv_appender(self, file_path: Path):
+        """Push rows buffered by an open appender to disk before the file is read"""
+        appender = self._csv_appenders.get(str(file_path))
+        if appender is not None:
+            appender[0].flush()
+    
     # Environment-based Data Keywords
     def get_environment_data(self, key: str, default: Any = None) -> Any:
         """
@@ -526,15 +1053,19 @@ class DataActions:
         
         env_name = env_manager.current_env
         env_data_file = f"environment_{env_name}.json"
+        file_path = self._json_dir / env_data_file
         
         try:
-            env_data = self.load_json_data(env_data_file, cache_key=f"env_{env_name}")
+            stat = file_path.stat()
+            # a private copy, so mutating the returned values cannot corrupt the shared snapshot
+            env_data = copy.deepcopy(_load_json_snapshot(str(file_path), stat.st_mtime_ns, stat.st_size))
+            self.cached_data[f"env_{env_name}"] = env_data
             value = env_data.get(key, default)
-            self.logger.info(f"Retrieved environment data for '{key}': {value}")
+            self.logger.info("Retrieved environment data for '%s': %s", key, value)
             return value
             
         except FileNotFoundError:
-            self.logger.warning(f"Environment data file not found: {env_data_file}")
+            self.logger.warning("Environment data file not found: %s", env_data_file)
             return default
     
     def set_environment_data(self, key: str, value: Any):
@@ -566,8 +1097,8 @@ class DataActions:
             # Update cache
             self.cache_data(f"env_{env_name}", env_data)
             
-            self.logger.info(f"Set environment data '{key}': {value}")
+            self.logger.info("Set environment data '%s': %s", key, value)
             
         except Exception as e:
-            self.logger.error(f"Failed to set environment data: {str(e)}")
+            self.logger.error("Failed to set environment data: %s", e)
             raise
\ No newline at end of file
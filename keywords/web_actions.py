@@ -5,17 +5,252 @@ This module provides high-level keyword actions for web testing
 that can be used across different test scenarios.
 """
 
-import time
+import functools
 import logging
-from typing import List, Dict, Any, Optional, Union
+import re
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Sequence
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    JavascriptException, TimeoutException, StaleElementReferenceException, WebDriverException
+)
+from selenium.webdriver.remote.webelement import WebElement
+
+from core import get_driver
+
+
+# Shared JS lookup of the first element matching a selenium (By, value) pair
+_FIND_ELEMENT_JS = """
+const find = (by, value) => {
+    switch (by) {
+        case 'css selector': return document.querySelector(value);
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0];
+        case 'class name': return document.getElementsByClassName(value)[0];
+        case 'tag name': return document.getElementsByTagName(value)[0];
+        case 'xpath': return document.evaluate(value, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'link text': return Array.from(document.links).find(a => a.innerText.trim() === value);
+        case 'partial link text': return Array.from(document.links).find(a => a.innerText.includes(value));
+        default: return null;
+    }
+};
+"""
+
+# Resolves (By, value) pairs in the page and reports presence and text in one round trip
+_BATCH_QUERY_SCRIPT = _FIND_ELEMENT_JS + """
+return arguments[0].map(([by, value]) => {
+    let el = null;
+    try { el = find(by, value); } catch (e) { el = null; }
+    return el ? {present: true, text: (el.innerText || '').trim()} : {present: false, text: ''};
+});
+"""
+
+# Reports presence, visibility and enabled state of each (By, value) pair without findElement's exception path
+_PROBE_ELEMENTS_SCRIPT = _FIND_ELEMENT_JS + """
+return arguments[0].map(([by, value]) => {
+    let el = null;
+    try { el = find(by, value); } catch (e) { el = null; }
+    if (!el) return {present: false, visible: false, enabled: false};
+    const style = getComputedStyle(el);
+    return {
+        present: true,
+        visible: el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0',
+        enabled: !el.matches(':disabled')
+    };
+});
+"""
+
+# Sets the value of visible text inputs/textareas and fires input/change; returns indexes it could not fill
+_FILL_FORM_SCRIPT = _FIND_ELEMENT_JS + """
+const skipped = [];
+arguments[0].forEach(([by, value, text], index) => {
+    let el = null;
+    try { el = find(by, value); } catch (e) { el = null; }
+    const fillable = el && !el.disabled && !el.readOnly && el.getClientRects().length > 0 &&
+        (el instanceof HTMLTextAreaElement ||
+         (el instanceof HTMLInputElement && !['checkbox', 'radio', 'file', 'submit', 'button'].includes(el.type)));
+    if (!fillable) { skipped.push(index); return; }
+    // the built-in prototype setter keeps framework-controlled inputs (e.g. React) in sync; it is taken
+    // from HTMLInputElement/HTMLTextAreaElement since subclassed inputs have no own value descriptor
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    try {
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+    } catch (e) { skipped.push(index); return; }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return skipped;
+"""
+
+# Centres the element and clicks it in the same round trip
+_SCROLL_AND_CLICK_SCRIPT = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# Sets a checkbox/radio to the wanted state and fires input/change only when it changed; returns whether it did
+_SET_CHECKED_SCRIPT = """
+const [el, checked] = arguments;
+if (el.checked === checked) return false;
+el.checked = checked;
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return true;
+"""
+
+# Scrolls instantly, then resolves after the next two frames (timer fallback for throttled background tabs)
+_SCROLL_INTO_VIEW_SCRIPT = """
+const [el, done] = arguments;
+el.scrollIntoView({block: 'center', behavior: 'instant'});
+let finished = false;
+const finish = () => { if (!finished) { finished = true; done(true); } };
+requestAnimationFrame(() => requestAnimationFrame(finish));
+setTimeout(finish, 100);
+"""
+
+# Resolves once the document has finished loading; the browser waits instead of Python polling readyState
+_WAIT_FOR_LOAD_SCRIPT = """
+const done = arguments[arguments.length - 1];
+if (document.readyState === 'complete') { done(true); return; }
+document.addEventListener('readystatechange', () => {
+    if (document.readyState === 'complete') done(true);
+});
+"""
+
+# Resolves true once the located element's text contains the needle, or false after the timeout (ms);
+# a MutationObserver re-checks on DOM changes so the browser waits instead of Python polling
+_WAIT_FOR_TEXT_SCRIPT = _FIND_ELEMENT_JS + """
+const [[by, value], needle, timeoutMs, done] = arguments;
+let finished = false;
+const finish = (found) => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(found);
+};
+const check = () => {
+    let el = null;
+    try { el = find(by, value); } catch (e) { el = null; }
+    // innerText matches what WebElement.text (and so the old expected condition) compared against
+    if (el && (el.innerText || '').includes(needle)) finish(true);
+};
+const observer = new MutationObserver(check);
+const timer = setTimeout(() => finish(false), timeoutMs);
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true, attributes: true});
+check();
+"""
+
+# Strategies the JS finder in _FIND_ELEMENT_JS understands
+_JS_STRATEGIES = frozenset({
+    By.CSS_SELECTOR, By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME, By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT,
+})
+
+
+# Tag names that are valid CSS type selectors as written
+_CSS_TAG_RE = re.compile(r'^[A-Za-z][A-Za-z0-9-]*$')
+
+
+def _css_string(value: str) -> str:
+    """Quote a value for use inside a CSS attribute selector"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\a ') + '"'
+
+
+def _to_css(locator: tuple) -> Optional[str]:
+    """
+    Translate a (By, value) locator into an equivalent CSS selector
+    
+    Args:
+        locator: Element locator tuple (By, value)
+        
+    Returns:
+        Optional[str]: CSS selector matching the same first element, or None if there is none
+    """
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return f"[id={_css_string(value)}]"
+    if by == By.NAME:
+        return f"[name={_css_string(value)}]"
+    if by == By.CLASS_NAME and value.split() == [value]:  # a single class, as Selenium requires
+        return f"[class~={_css_string(value)}]"
+    if by == By.TAG_NAME and _CSS_TAG_RE.match(value):
+        return value
+    return None
+
+
+def _prepare_locator(locator: Sequence) -> tuple:
+    """
+    Validate a (By, value) locator once and return it in the form the batched JS helpers take
+    
+    Lists such as ["id", "username"] are accepted like tuples; they are converted before the
+    cached lookup since lru_cache needs hashable arguments.
+    
+    Args:
+        locator: Element locator tuple or list (By, value)
+        
+    Returns:
+        tuple: The (strategy, selector) pair, ready to serialize as a JS array
+    """
+    return _prepare_locator_cached(tuple(locator))
+
+
+@functools.lru_cache(maxsize=1024)
+def _prepare_locator_cached(locator: tuple) -> tuple:
+    """
+    Validate and translate a (By, value) tuple (cached implementation of _prepare_locator)
+    
+    Locators with a CSS equivalent are rewritten to it, so the page resolves them with
+    querySelector; only XPath and link text fall through to the other finder branches.
+    
+    Args:
+        locator: Element locator tuple (By, value)
+        
+    Returns:
+        tuple: The (strategy, selector) pair, ready to serialize as a JS array
+    """
+    if len(locator) != 2 or locator[0] not in _JS_STRATEGIES:
+        raise ValueError(f"Unsupported locator: {locator!r}")
+    css = _to_css(locator)
+    return (By.CSS_SELECTOR, css) if css is not None else locator
+
+
+# Configured once at import; every WebActions instance shares it. Records carry milliseconds since
+# logging was loaded (relativeCreated) instead of asctime, which costs a localtime/strftime per record.
+logger = logging.getLogger('WebActions')
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter(
+        '%(relativeCreated)d - %(name)s - %(levelname)s - %(message)s'
+    ))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
 
-from core import get_driver, assertion_manager
-from pages import LoginPage, DashboardPage
+def _uses_keep_alive(driver) -> Optional[bool]:
+    """Whether the driver's command connection reuses sockets (None when it cannot be told)"""
+    executor = getattr(driver, 'command_executor', None)
+    keep_alive = getattr(executor, 'keep_alive', None)
+    if keep_alive is None:
+        # newer selenium keeps connection settings on a ClientConfig
+        keep_alive = getattr(getattr(executor, '_client_config', None), 'keep_alive', None)
+    return keep_alive
+
+
+def _is_attached(element: WebElement) -> bool:
+    """Touch the element; any call raises StaleElementReferenceException once it left the DOM"""
+    element.is_enabled()
+    return True
+
+
+# How _locate re-validates a cached element for each supported wait condition
+_CACHED_ELEMENT_CHECKS = {
+    EC.presence_of_element_located: _is_attached,
+    EC.visibility_of_element_located: lambda element: element.is_displayed(),
+    EC.element_to_be_clickable: lambda element: element.is_displayed() and element.is_enabled(),
+}
 
 
 class WebActions:
@@ -23,33 +258,118 @@ class WebActions:
     
     def __init__(self):
         self.driver = None
-        self.logger = self._setup_logger()
+        self.logger = logger
         self.login_page = None
         self.dashboard_page = None
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for web actions"""
-        logger = logging.getLogger('WebActions')
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        return logger
+        # Set once driver and page objects are bound, so later keywords skip _ensure_driver's checks
+        self._ready = False
+        # Async script timeout last sent to the driver, so it is only set when it changes
+        self._script_timeout = None
+        # Driver's implicit wait in seconds, read once so explicit waits can switch it off
+        self._implicit_wait = None
+        # Elements found by _locate, reused until they go stale or the page is navigated
+        self._element_cache: Dict[tuple, WebElement] = {}
     
     def _ensure_driver(self):
         """Ensure driver is available"""
+        if self._ready:
+            return
+        
         if not self.driver:
             self.driver = get_driver()
+            if _uses_keep_alive(self.driver) is False:
+                self.logger.warning("WebDriver connection has keep-alive disabled; every command opens a new socket")
+        
+        if not self.login_page or not self.dashboard_page:
+            # page objects are only needed once a browser is in play
+            from pages import LoginPage, DashboardPage
+            
+            # shared with every other WebActions/test bound to the same driver
+            self.login_page = self.login_page or LoginPage.for_driver(self.driver)
+            self.dashboard_page = self.dashboard_page or DashboardPage.for_driver(self.driver)
+        
+        self._ready = True
+    
+    def _mark_navigation(self):
+        """Record that a new document was loaded, so every cached element is gone"""
+        self._element_cache.clear()
+    
+    def reset_driver(self):
+        """Forget the bound driver so the next keyword resolves the thread's current one"""
+        self.driver = None
+        self.login_page = None
+        self.dashboard_page = None
+        self._ready = False
+        self._script_timeout = None
+        self._implicit_wait = None
+        self._mark_navigation()
+    
+    def _locate(self, locator: tuple, timeout: int, condition) -> WebElement:
+        """
+        Wait for an element, reusing the one found earlier for the same locator while it is still valid
+        
+        Args:
+            locator: Element locator tuple (By, value)
+            timeout: Wait timeout in seconds when the element has to be looked up
+            condition: expected_conditions factory (presence, visibility or clickability)
+            
+        Returns:
+            WebElement: Located element
+        """
+        locator = tuple(locator)  # list locators are accepted too, but cache keys must be hashable
+        element = self._element_cache.get(locator)
+        if element is not None:
+            try:
+                # one call re-checks the condition on the cached element instead of a fresh findElement
+                if _CACHED_ELEMENT_CHECKS[condition](element):
+                    return element
+            except StaleElementReferenceException:
+                pass
+            del self._element_cache[locator]
+        
+        with self._no_implicit_wait():
+            element = WebDriverWait(self.driver, timeout).until(condition(locator))
+        self._element_cache[locator] = element
+        return element
+    
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Switch the driver's implicit wait off while an explicit WebDriverWait polls
         
-        if not self.login_page:
-            self.login_page = LoginPage(self.driver)
+        Otherwise every poll that finds nothing blocks for the implicit timeout as well, so absent
+        elements overshoot the explicit timeout. A no-op when no implicit wait is configured.
+        """
+        if self._implicit_wait is None:
+            self._implicit_wait = self.driver.timeouts.implicit_wait
         
-        if not self.dashboard_page:
-            self.dashboard_page = DashboardPage(self.driver)
+        if not self._implicit_wait:
+            yield
+            return
+        
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self._implicit_wait)
+    
+    def _set_script_timeout(self, timeout: int):
+        """Send the async script timeout to the driver only when it differs from the last one set"""
+        if self._script_timeout != timeout:
+            self.driver.set_script_timeout(timeout)
+            self._script_timeout = timeout
+    
+    def _wait_for_page_load(self, timeout: int = 10):
+        """
+        Block until document.readyState is 'complete' using one async script call
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        self._set_script_timeout(timeout)
+        
+        # a script timeout surfaces as TimeoutException, as the old WebDriverWait did
+        self.driver.execute_async_script(_WAIT_FOR_LOAD_SCRIPT)
     
     # Navigation Keywords
     def navigate_to_url(self, url: str):
@@ -68,38 +388,39 @@ class WebActions:
             base_url = get_base_url()
             full_url = f"{base_url.rstrip('/')}/{url.lstrip('/')}"
         
-        self.logger.info(f"Navigating to URL: {full_url}")
+        self.logger.info("Navigating to URL: %s", full_url)
         self.driver.get(full_url)
+        self._mark_navigation()
         
         # Wait for page to load
-        WebDriverWait(self.driver, 10).until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
-        )
+        self._wait_for_page_load()
         
-        self.logger.info(f"Successfully navigated to: {self.driver.current_url}")
+        if self.logger.isEnabledFor(logging.DEBUG):  # current_url is a browser round trip
+            self.logger.debug("Successfully navigated to: %s", self.driver.current_url)
     
     def refresh_page(self):
         """Refresh the current page"""
         self._ensure_driver()
         self.logger.info("Refreshing current page")
         self.driver.refresh()
+        self._mark_navigation()
         
         # Wait for page to reload
-        WebDriverWait(self.driver, 10).until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
-        )
+        self._wait_for_page_load()
     
     def go_back(self):
         """Navigate back in browser history"""
         self._ensure_driver()
         self.logger.info("Navigating back in browser history")
         self.driver.back()
+        self._mark_navigation()
     
     def go_forward(self):
         """Navigate forward in browser history"""
         self._ensure_driver()
         self.logger.info("Navigating forward in browser history")
         self.driver.forward()
+        self._mark_navigation()
     
     # Authentication Keywords
     def login_user(self, username: str, password: str, remember_me: bool = False) -> bool:
@@ -115,24 +436,28 @@ class WebActions:
             bool: True if login successful, False otherwise
         """
         self._ensure_driver()
-        self.logger.info(f"Attempting to login user: {username}")
+        self.logger.info("Attempting to login user: %s", username)
         
         # Navigate to login page if not already there
-        current_url = self.driver.current_url
-        if "login" not in current_url.lower():
-            self.login_page.open_login_page()
+        self._open_login_page()
         
         # Perform login
         success = self.login_page.login(username, password, remember_me)
         
         if success:
-            self.logger.info(f"Login successful for user: {username}")
+            self.logger.info("Login successful for user: %s", username)
         else:
             error_msg = self.login_page.get_error_message()
-            self.logger.error(f"Login failed for user {username}: {error_msg}")
+            self.logger.error("Login failed for user %s: %s", username, error_msg)
         
         return success
     
+    def _open_login_page(self):
+        """Load the login page unless the current URL shows the browser is already on it"""
+        current_url = self.driver.current_url
+        if self.login_page.open_login_page(current_url=current_url):
+            self._mark_navigation()
+    
     def quick_login(self) -> bool:
         """
         Quick login using default credentials from configuration
@@ -143,54 +468,67 @@ class WebActions:
         self._ensure_driver()
         self.logger.info("Performing quick login with default credentials")
         
-        if "login" not in self.driver.current_url.lower():
-            self.login_page.open_login_page()
+        self._open_login_page()
         
-        return self.login_page.quick_login()
+        success = self.login_page.quick_login()
+        return success
     
     def logout_user(self):
         """Logout current user"""
         self._ensure_driver()
         self.logger.info("Attempting to logout user")
         
-        # Try logout from dashboard first
         try:
-            self.dashboard_page.logout()
-            self.logger.info("Logout successful from dashboard")
-        except:
-            # Try logout from login page
-            try:
+            # One probe decides which page's logout control exists instead of failing through both
+            dashboard_logout, dashboard_menu, login_logout = self.bulk_check_elements([
+                self.dashboard_page.LOGOUT_BUTTON, self.dashboard_page.USER_MENU, self.login_page.LOGOUT_BUTTON,
+            ])
+            
+            if dashboard_logout['present'] or dashboard_menu['present']:
+                self.dashboard_page.logout()
+                self.logger.info("Logout successful from dashboard")
+            elif login_logout['present']:
                 self.login_page.logout()
                 self.logger.info("Logout successful from login page")
-            except:
+            else:
                 self.logger.warning("Could not find logout option")
+        except WebDriverException as e:
+            # missing, covered, stale or unclickable controls, as well as a failed probe
+            self.logger.warning("Could not logout: %s", e)
     
     # Element Interaction Keywords
-    def click_element(self, locator: tuple, timeout: int = 10):
+    def click_element(self, locator: tuple, timeout: int = 10, element: Optional[WebElement] = None,
+                      js_click: bool = False):
         """
         Click on element with wait
         
         Args:
             locator: Element locator tuple (By, value)
             timeout: Wait timeout in seconds
+            element: Element already located (e.g. from wait_for_element_visible); skips the wait
+            js_click: Scroll and click in one script call (HTMLElement.click()) instead of WebDriver's
+                element click; skips overlay checks and real pointer events, so only use it for
+                controls known to be unobstructed
         """
         self._ensure_driver()
-        self.logger.info(f"Clicking element: {locator}")
+        self.logger.info("Clicking element: %s", locator)
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            # Scroll into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            element.click()
-            self.logger.info(f"Successfully clicked element: {locator}")
+            if element is None:
+                element = self._locate(locator, timeout, EC.element_to_be_clickable)
+            if js_click:
+                self.driver.execute_script(_SCROLL_AND_CLICK_SCRIPT, element)
+            else:
+                # WebDriver scrolls the element into view itself before clicking
+                element.click()
+            self.logger.debug("Successfully clicked element: %s", locator)
             
         except TimeoutException:
-            self.logger.error(f"Element not clickable within {timeout}s: {locator}")
+            self.logger.error("Element not clickable within %ss: %s", timeout, locator)
             raise
     
-    def type_text(self, locator: tuple, text: str, clear_first: bool = True, timeout: int = 10):
+    def type_text(self, locator: tuple, text: str, clear_first: bool = True, timeout: int = 10,
+                  element: Optional[WebElement] = None):
         """
         Type text into element
         
@@ -199,50 +537,50 @@ class WebActions:
             text: Text to type
             clear_first: Whether to clear field before typing
             timeout: Wait timeout in seconds
+            element: Element already located (e.g. from wait_for_element_visible); skips the wait
         """
         self._ensure_driver()
-        self.logger.info(f"Typing text into element {locator}: '{text}'")
+        self.logger.info("Typing text into element %s: '%s'", locator, text)
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            if element is None:
+                element = self._locate(locator, timeout, EC.visibility_of_element_located)
             
             if clear_first:
                 element.clear()
             
             element.send_keys(text)
-            self.logger.info(f"Successfully typed text into element: {locator}")
+            self.logger.debug("Successfully typed text into element: %s", locator)
             
         except TimeoutException:
-            self.logger.error(f"Element not visible within {timeout}s: {locator}")
+            self.logger.error("Element not visible within %ss: %s", timeout, locator)
             raise
     
-    def get_element_text(self, locator: tuple, timeout: int = 10) -> str:
+    def get_element_text(self, locator: tuple, timeout: int = 10, element: Optional[WebElement] = None) -> str:
         """
         Get text content from element
         
         Args:
             locator: Element locator tuple (By, value)
             timeout: Wait timeout in seconds
+            element: Element already located (e.g. from wait_for_element_visible); skips the wait
             
         Returns:
             str: Element text content
         """
         self._ensure_driver()
-        self.logger.info(f"Getting text from element: {locator}")
+        self.logger.info("Getting text from element: %s", locator)
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            if element is None:
+                element = self._locate(locator, timeout, EC.visibility_of_element_located)
             
             text = element.text
-            self.logger.info(f"Got text from element {locator}: '{text}'")
+            self.logger.debug("Got text from element %s: '%s'", locator, text)
             return text
             
         except TimeoutException:
-            self.logger.error(f"Element not visible within {timeout}s: {locator}")
+            self.logger.error("Element not visible within %ss: %s", timeout, locator)
             raise
     
     def get_element_attribute(self, locator: tuple, attribute: str, timeout: int = 10) -> str:
@@ -258,19 +596,17 @@ class WebActions:
             str: Attribute value
         """
         self._ensure_driver()
-        self.logger.info(f"Getting attribute '{attribute}' from element: {locator}")
+        self.logger.info("Getting attribute '%s' from element: %s", attribute, locator)
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            element = self._locate(locator, timeout, EC.presence_of_element_located)
             
             value = element.get_attribute(attribute) or ""
-            self.logger.info(f"Got attribute '{attribute}' from element {locator}: '{value}'")
+            self.logger.debug("Got attribute '%s' from element %s: '%s'", attribute, locator, value)
             return value
             
         except TimeoutException:
-            self.logger.error(f"Element not found within {timeout}s: {locator}")
+            self.logger.error("Element not found within %ss: %s", timeout, locator)
             raise
     
     def select_dropdown_option(self, dropdown_locator: tuple, option_text: str, timeout: int = 10):
@@ -283,77 +619,87 @@ class WebActions:
             timeout: Wait timeout in seconds
         """
         self._ensure_driver()
-        self.logger.info(f"Selecting dropdown option '{option_text}' from: {dropdown_locator}")
+        self.logger.info("Selecting dropdown option '%s' from: %s", option_text, dropdown_locator)
         
         from selenium.webdriver.support.ui import Select
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(dropdown_locator)
-            )
+            element = self._locate(dropdown_locator, timeout, EC.element_to_be_clickable)
             
             select = Select(element)
             select.select_by_visible_text(option_text)
-            self.logger.info(f"Successfully selected option: {option_text}")
+            self.logger.debug("Successfully selected option: %s", option_text)
             
         except TimeoutException:
-            self.logger.error(f"Dropdown not clickable within {timeout}s: {dropdown_locator}")
+            self.logger.error("Dropdown not clickable within %ss: %s", timeout, dropdown_locator)
             raise
     
-    def check_checkbox(self, locator: tuple, timeout: int = 10):
+    def check_checkbox(self, locator: tuple, timeout: int = 10, native_click: bool = False):
         """
         Check checkbox if not already checked
         
         Args:
             locator: Checkbox element locator
             timeout: Wait timeout in seconds
+            native_click: Read the state and click through WebDriver, for pages whose handlers
+                only react to a real click
         """
         self._ensure_driver()
-        self.logger.info(f"Checking checkbox: {locator}")
+        self.logger.info("Checking checkbox: %s", locator)
         
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            
-            if not element.is_selected():
-                element.click()
-                self.logger.info(f"Checkbox checked: {locator}")
-            else:
-                self.logger.info(f"Checkbox already checked: {locator}")
-                
-        except TimeoutException:
-            self.logger.error(f"Checkbox not clickable within {timeout}s: {locator}")
-            raise
+        if self._set_checkbox(locator, True, timeout, native_click):
+            self.logger.debug("Checkbox checked: %s", locator)
+        else:
+            self.logger.debug("Checkbox already checked: %s", locator)
     
-    def uncheck_checkbox(self, locator: tuple, timeout: int = 10):
+    def uncheck_checkbox(self, locator: tuple, timeout: int = 10, native_click: bool = False):
         """
         Uncheck checkbox if currently checked
         
         Args:
             locator: Checkbox element locator
             timeout: Wait timeout in seconds
+            native_click: Read the state and click through WebDriver, for pages whose handlers
+                only react to a real click
         """
         self._ensure_driver()
-        self.logger.info(f"Unchecking checkbox: {locator}")
+        self.logger.info("Unchecking checkbox: %s", locator)
         
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
+        if self._set_checkbox(locator, False, timeout, native_click):
+            self.logger.debug("Checkbox unchecked: %s", locator)
+        else:
+            self.logger.debug("Checkbox already unchecked: %s", locator)
+    
+    def _set_checkbox(self, locator: tuple, checked: bool, timeout: int, native_click: bool) -> bool:
+        """
+        Bring a checkbox to the wanted state
+        
+        Args:
+            locator: Checkbox element locator
+            checked: State the checkbox should end up in
+            timeout: Wait timeout in seconds
+            native_click: Use is_selected() + click() instead of the single script call
             
-            if element.is_selected():
-                element.click()
-                self.logger.info(f"Checkbox unchecked: {locator}")
-            else:
-                self.logger.info(f"Checkbox already unchecked: {locator}")
-                
+        Returns:
+            bool: True if the state was changed, False if it already matched
+        """
+        try:
+            element = self._locate(locator, timeout, EC.element_to_be_clickable)
         except TimeoutException:
-            self.logger.error(f"Checkbox not clickable within {timeout}s: {locator}")
+            self.logger.error("Checkbox not clickable within %ss: %s", timeout, locator)
             raise
+        
+        if native_click:
+            if element.is_selected() == checked:
+                return False
+            element.click()
+            return True
+        
+        # reads and sets the state in one round trip instead of is_selected() followed by click()
+        return self.driver.execute_script(_SET_CHECKED_SCRIPT, element, checked)
     
     # Wait Keywords
-    def wait_for_element_visible(self, locator: tuple, timeout: int = 10) -> bool:
+    def wait_for_element_visible(self, locator: tuple, timeout: int = 10) -> Optional[WebElement]:
         """
         Wait for element to be visible
         
@@ -362,21 +708,19 @@ class WebActions:
             timeout: Wait timeout in seconds
             
         Returns:
-            bool: True if element becomes visible, False if timeout
+            WebElement or None: The visible element (truthy, can be passed on as element=...), None if timeout
         """
         self._ensure_driver()
-        self.logger.info(f"Waiting for element to be visible: {locator}")
+        self.logger.info("Waiting for element to be visible: %s", locator)
         
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
-            self.logger.info(f"Element became visible: {locator}")
-            return True
+            element = self._locate(locator, timeout, EC.visibility_of_element_located)
+            self.logger.debug("Element became visible: %s", locator)
+            return element
             
         except TimeoutException:
-            self.logger.warning(f"Element not visible within {timeout}s: {locator}")
-            return False
+            self.logger.warning("Element not visible within %ss: %s", timeout, locator)
+            return None
     
     def wait_for_element_invisible(self, locator: tuple, timeout: int = 10) -> bool:
         """
@@ -390,17 +734,18 @@ class WebActions:
             bool: True if element becomes invisible, False if timeout
         """
         self._ensure_driver()
-        self.logger.info(f"Waiting for element to be invisible: {locator}")
+        self.logger.info("Waiting for element to be invisible: %s", locator)
         
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located(locator)
-            )
-            self.logger.info(f"Element became invisible: {locator}")
+            with self._no_implicit_wait():
+                WebDriverWait(self.driver, timeout).until(
+                    EC.invisibility_of_element_located(locator)
+                )
+            self.logger.debug("Element became invisible: %s", locator)
             return True
             
         except TimeoutException:
-            self.logger.warning(f"Element still visible after {timeout}s: {locator}")
+            self.logger.warning("Element still visible after %ss: %s", timeout, locator)
             return False
     
     def wait_for_text_present(self, locator: tuple, text: str, timeout: int = 10) -> bool:
@@ -416,18 +761,35 @@ class WebActions:
             bool: True if text appears, False if timeout
         """
         self._ensure_driver()
-        self.logger.info(f"Waiting for text '{text}' in element: {locator}")
+        self.logger.info("Waiting for text '%s' in element: %s", text, locator)
         
+        # one async call instead of a findElement + getText round trip every poll; the script timeout
+        # gets a second of slack so the in-page timer, not the driver, normally ends the wait
+        deadline = time.monotonic() + timeout
+        self._set_script_timeout(timeout + 1)
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.text_to_be_present_in_element(locator, text)
-            )
-            self.logger.info(f"Text '{text}' found in element: {locator}")
-            return True
-            
+            found = self.driver.execute_async_script(_WAIT_FOR_TEXT_SCRIPT, _prepare_locator(locator), text,
+                                                     timeout * 1000)
         except TimeoutException:
-            self.logger.warning(f"Text '{text}' not found within {timeout}s: {locator}")
-            return False
+            found = False
+        except JavascriptException:
+            # the page navigated while the script waited ("document unloaded"); poll the new page
+            # for the rest of the timeout
+            self._mark_navigation()
+            try:
+                with self._no_implicit_wait():
+                    found = WebDriverWait(self.driver, max(deadline - time.monotonic(), 0)).until(
+                        EC.text_to_be_present_in_element(locator, text)
+                    )
+            except TimeoutException:
+                found = False
+        
+        if found:
+            self.logger.debug("Text '%s' found in element: %s", text, locator)
+            return True
+        
+        self.logger.warning("Text '%s' not found within %ss: %s", text, timeout, locator)
+        return False
     
     # Utility Keywords
     def take_screenshot(self, filename: str = None) -> str:
@@ -453,19 +815,18 @@ class WebActions:
             timeout: Wait timeout in seconds
         """
         self._ensure_driver()
-        self.logger.info(f"Scrolling to element: {locator}")
+        self.logger.info("Scrolling to element: %s", locator)
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            element = self._locate(locator, timeout, EC.presence_of_element_located)
             
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)  # Small delay for scroll completion
-            self.logger.info(f"Scrolled to element: {locator}")
+            # resolves once the scroll has been rendered instead of sleeping a fixed delay
+            self._set_script_timeout(timeout)
+            self.driver.execute_async_script(_SCROLL_INTO_VIEW_SCRIPT, element)
+            self.logger.debug("Scrolled to element: %s", locator)
             
         except TimeoutException:
-            self.logger.error(f"Element not found for scrolling: {locator}")
+            self.logger.error("Element not found for scrolling: %s", locator)
             raise
     
     def hover_over_element(self, locator: tuple, timeout: int = 10):
@@ -477,21 +838,19 @@ class WebActions:
             timeout: Wait timeout in seconds
         """
         self._ensure_driver()
-        self.logger.info(f"Hovering over element: {locator}")
+        self.logger.info("Hovering over element: %s", locator)
         
         from selenium.webdriver.common.action_chains import ActionChains
         
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            element = self._locate(locator, timeout, EC.visibility_of_element_located)
             
             actions = ActionChains(self.driver)
             actions.move_to_element(element).perform()
-            self.logger.info(f"Hovered over element: {locator}")
+            self.logger.debug("Hovered over element: %s", locator)
             
         except TimeoutException:
-            self.logger.error(f"Element not visible for hover: {locator}")
+            self.logger.error("Element not visible for hover: %s", locator)
             raise
     
     def execute_javascript(self, script: str, *args) -> Any:
@@ -506,10 +865,10 @@ class WebActions:
             Any: Result of JavaScript execution
         """
         self._ensure_driver()
-        self.logger.info(f"Executing JavaScript: {script}")
+        self.logger.info("Executing JavaScript: %s", script)
         
         result = self.driver.execute_script(script, *args)
-        self.logger.info(f"JavaScript execution completed")
+        self.logger.debug("JavaScript execution completed")
         return result
     
     # Form Keywords
@@ -517,14 +876,22 @@ class WebActions:
         """
         Fill form with provided data
         
+        Visible text inputs and textareas are filled in a single script call; any other field
+        (not rendered yet, contenteditable, select, ...) falls back to type_text.
+        
         Args:
             form_data: Dictionary mapping locators to values
             submit_button: Optional submit button locator
         """
         self._ensure_driver()
-        self.logger.info(f"Filling form with {len(form_data)} fields")
+        self.logger.info("Filling form with %d fields", len(form_data))
         
-        for locator, value in form_data.items():
+        fields = list(form_data.items())
+        payload = [(*_prepare_locator(locator), str(value)) for locator, value in fields]
+        skipped = self.driver.execute_script(_FILL_FORM_SCRIPT, payload) if payload else []
+        
+        for index in skipped:
+            locator, value = fields[index]
             self.type_text(locator, value)
         
         if submit_button:
@@ -532,6 +899,34 @@ class WebActions:
             self.logger.info("Form submitted")
     
     # Validation Keywords
+    def _probe_element(self, locator: tuple) -> Dict[str, bool]:
+        """
+        Look up an element in the page and report its state in one script call
+        
+        Args:
+            locator: Element locator tuple (By, value)
+            
+        Returns:
+            Dict[str, bool]: {'present', 'visible', 'enabled'} flags (all False when absent)
+        """
+        return self.driver.execute_script(_PROBE_ELEMENTS_SCRIPT, [_prepare_locator(locator)])[0]
+    
+    def bulk_check_elements(self, locators: Sequence[tuple]) -> List[Dict[str, bool]]:
+        """
+        Check presence, visibility and enabled state of several elements in a single script call
+        
+        Args:
+            locators: Element locator tuples (By, value)
+            
+        Returns:
+            List[Dict[str, bool]]: One {'present', 'visible', 'enabled'} dict per locator, in order
+        """
+        self._ensure_driver()
+        
+        if not locators:
+            return []
+        return self.driver.execute_script(_PROBE_ELEMENTS_SCRIPT, [_prepare_locator(locator) for locator in locators])
+    
     def is_element_present(self, locator: tuple) -> bool:
         """
         Check if element is present in DOM
@@ -543,12 +938,7 @@ class WebActions:
             bool: True if element is present, False otherwise
         """
         self._ensure_driver()
-        
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
+        return self._probe_element(locator)['present']
     
     def is_element_visible(self, locator: tuple) -> bool:
         """
@@ -561,12 +951,7 @@ class WebActions:
             bool: True if element is visible, False otherwise
         """
         self._ensure_driver()
-        
-        try:
-            element = self.driver.find_element(*locator)
-            return element.is_displayed()
-        except NoSuchElementException:
-            return False
+        return self._probe_element(locator)['visible']
     
     def is_element_enabled(self, locator: tuple) -> bool:
         """
@@ -579,12 +964,23 @@ class WebActions:
             bool: True if element is enabled, False otherwise
         """
         self._ensure_driver()
+        return self._probe_element(locator)['enabled']
+    
+    def batch_query(self, locators: Sequence[tuple]) -> List[Dict[str, Any]]:
+        """
+        Check presence and text of several elements in a single script call
+        
+        Args:
+            locators: Element locator tuples (By, value)
+            
+        Returns:
+            List[Dict[str, Any]]: One {'present': bool, 'text': str} per locator, in order
+        """
+        self._ensure_driver()
         
-        try:
-            element = self.driver.find_element(*locator)
-            return element.is_enabled()
-        except NoSuchElementException:
-            return False
+        if not locators:
+            return []
+        return self.driver.execute_script(_BATCH_QUERY_SCRIPT, [_prepare_locator(locator) for locator in locators])
     
     # Page Information Keywords
     def get_page_title(self) -> str:
@@ -596,7 +992,7 @@ class WebActions:
         """
         self._ensure_driver()
         title = self.driver.title
-        self.logger.info(f"Current page title: '{title}'")
+        self.logger.info("Current page title: '%s'", title)
         return title
     
     def get_current_url(self) -> str:
@@ -608,7 +1004,7 @@ class WebActions:
         """
         self._ensure_driver()
         url = self.driver.current_url
-        self.logger.info(f"Current URL: '{url}'")
+        self.logger.info("Current URL: '%s'", url)
         return url
     
     def get_page_source(self) -> str:
@@ -620,4 +1016,24 @@ class WebActions:
         """
         self._ensure_driver()
         self.logger.info("Getting page source")
-        return self.driver.page_source
\ No newline at end of file
+        return self.driver.page_source
+    
+    def get_page_text(self) -> str:
+        """
+        Get rendered text of the page body
+        
+        Returns:
+            str: document.body.innerText
+        """
+        self._ensure_driver()
+        return self.driver.execute_script("return document.body ? document.body.innerText : ''")
+    
+    def get_page_source_length(self) -> int:
+        """
+        Get length of the page HTML without transferring the markup
+        
+        Returns:
+            int: Length of document.documentElement.outerHTML
+        """
+        self._ensure_driver()
+        return self.driver.execute_script("return document.documentElement.outerHTML.length")
\ No newline at end of file
@@ -7,11 +7,28 @@ navigation menus that are shared across multiple pages.
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException
 from typing import List, Dict, Optional
 
 from core import BasePage, assertion_manager
 
 
+# Clicks the close target only if the menu is currently shown; returns whether it clicked
+_CLOSE_IF_VISIBLE_SCRIPT = """
+const [menuSelector, targetSelector] = arguments;
+const menu = document.querySelector(menuSelector);
+if (!menu || menu.getClientRects().length === 0 || getComputedStyle(menu).visibility === 'hidden') return false;
+const target = document.querySelector(targetSelector);
+if (!target) return false;
+target.click();
+return true;
+"""
+
+# True when every selector in the list matches something on the page
+_ALL_PRESENT_SCRIPT = "return arguments[0].every(selector => document.querySelector(selector) !== null);"
+
+
 class Header(BasePage):
     """Header component with navigation and user controls"""
     
@@ -33,6 +50,10 @@ class Header(BasePage):
     REGISTER_LINK = (By.CSS_SELECTOR, "[data-action='register'], .register-link")
     USER_AVATAR = (By.CSS_SELECTOR, ".user-avatar, .profile-avatar")
     USER_MENU_TOGGLE = (By.CSS_SELECTOR, ".user-menu-toggle, .profile-dropdown-toggle")
+    # Matches if either logged-in control exists, so one lookup answers is_user_logged_in
+    LOGGED_IN_CONTROLS = (By.CSS_SELECTOR, f"{USER_AVATAR[1]}, {USER_MENU_TOGGLE[1]}")
+    # Both must exist for is_user_logged_out
+    LOGGED_OUT_SELECTORS = (LOGIN_LINK[1], REGISTER_LINK[1])
     
     # User dropdown menu
     USER_DROPDOWN = (By.CSS_SELECTOR, ".user-dropdown, .profile-dropdown")
@@ -89,36 +110,44 @@ class Header(BasePage):
         self.click(self.REGISTER_LINK)
         self.logger.info("Register link clicked")
     
-    def open_user_menu(self):
-        """Open user dropdown menu"""
+    def open_user_menu(self) -> Optional[WebElement]:
+        """Open user dropdown menu and return the dropdown element (None if it did not appear)"""
         self.click(self.USER_MENU_TOGGLE)
-        self.wait_for_element_visible(self.USER_DROPDOWN)
+        dropdown = self.wait_for_element_visible(self.USER_DROPDOWN)
         self.logger.info("User menu opened")
+        return dropdown
+    
+    def _click_in_user_menu(self, locator: tuple):
+        """Open the user menu and click an entry found inside the dropdown just opened"""
+        dropdown = self.open_user_menu()
+        # The dropdown reference lives only for this call, so it cannot go stale across navigations
+        if dropdown is not None:
+            try:
+                dropdown.find_element(*locator).click()
+                return
+            except (NoSuchElementException, ElementNotInteractableException):
+                pass
+        self.click(locator)
     
     def close_user_menu(self):
         """Close user dropdown menu if open"""
-        if self.is_element_visible(self.USER_DROPDOWN):
-            # Click outside the menu to close it
-            self.click(self.HEADER_CONTAINER)
-            self.wait_for_element_invisible(self.USER_DROPDOWN)
+        # Click outside the menu to close it
+        if self._close_if_visible(self.USER_DROPDOWN, self.HEADER_CONTAINER):
             self.logger.info("User menu closed")
     
     def navigate_to_profile(self):
         """Navigate to user profile from header"""
-        self.open_user_menu()
-        self.click(self.PROFILE_LINK)
+        self._click_in_user_menu(self.PROFILE_LINK)
         self.logger.info("Navigated to profile from header")
     
     def navigate_to_settings(self):
         """Navigate to settings from header"""
-        self.open_user_menu()
-        self.click(self.SETTINGS_LINK)
+        self._click_in_user_menu(self.SETTINGS_LINK)
         self.logger.info("Navigated to settings from header")
     
     def logout(self):
         """Logout from header user menu"""
-        self.open_user_menu()
-        self.click(self.LOGOUT_LINK)
+        self._click_in_user_menu(self.LOGOUT_LINK)
         self.logger.info("Logout clicked from header")
     
     # Mobile menu methods
@@ -130,48 +159,41 @@ class Header(BasePage):
     
     def close_mobile_menu(self):
         """Close mobile navigation menu"""
-        if self.is_element_visible(self.MOBILE_MENU):
-            self.click(self.MOBILE_MENU_TOGGLE)
-            self.wait_for_element_invisible(self.MOBILE_MENU)
+        if self._close_if_visible(self.MOBILE_MENU, self.MOBILE_MENU_TOGGLE):
             self.logger.info("Mobile menu closed")
     
+    def _close_if_visible(self, menu_locator: tuple, close_locator: tuple) -> bool:
+        """Click close_locator only when the menu is shown, checking and clicking in one script call"""
+        if not self.driver.execute_script(_CLOSE_IF_VISIBLE_SCRIPT, menu_locator[1], close_locator[1]):
+            return False
+        self.wait_for_element_invisible(menu_locator)
+        return True
+    
     # State checking methods
     def is_user_logged_in(self) -> bool:
         """Check if user appears to be logged in based on header elements"""
-        return (self.is_element_present(self.USER_AVATAR) or 
-                self.is_element_present(self.USER_MENU_TOGGLE))
+        with self.no_implicit_wait():
+            return self.is_element_present(self.LOGGED_IN_CONTROLS)
     
     def is_user_logged_out(self) -> bool:
         """Check if user appears to be logged out based on header elements"""
-        return (self.is_element_present(self.LOGIN_LINK) and 
-                self.is_element_present(self.REGISTER_LINK))
+        return self.driver.execute_script(_ALL_PRESENT_SCRIPT, self.LOGGED_OUT_SELECTORS)
     
     def get_navigation_links(self) -> List[str]:
         """Get list of visible navigation links"""
-        links = []
-        nav_elements = self.find_elements(self.MAIN_NAVIGATION)
-        
-        for nav in nav_elements:
-            try:
-                link_elements = nav.find_elements(By.TAG_NAME, "a")
-                for link in link_elements:
-                    if link.is_displayed():
-                        links.append(link.text)
-            except:
-                continue
-        
-        return links
+        return self._collect_texts(self.MAIN_NAVIGATION, "a", visible_only=True)
     
     # Assertion methods
     def assert_header_present(self):
         """Assert that header is present and visible"""
+        header, = self._probe(self.HEADER_CONTAINER)
         assertion_manager.assert_true(
-            self.is_element_present(self.HEADER_CONTAINER),
+            header['present'],
             "Header should be present on the page"
         )
         
         assertion_manager.assert_true(
-            self.is_element_visible(self.HEADER_CONTAINER),
+            header['visible'],
             "Header should be visible"
         )
     
@@ -210,14 +232,24 @@ class Footer(BasePage):
     # Footer container and sections
     FOOTER_CONTAINER = (By.CSS_SELECTOR, "footer, .footer, .site-footer")
     FOOTER_LINKS = (By.CSS_SELECTOR, ".footer-links")
+    FOOTER_LINK_ANCHORS = (By.CSS_SELECTOR, ".footer-links a")
     FOOTER_INFO = (By.CSS_SELECTOR, ".footer-info")
     COPYRIGHT_TEXT = (By.CSS_SELECTOR, ".copyright, .footer-copyright")
     
     # Common footer links
-    PRIVACY_LINK = (By.LINK_TEXT, "Privacy Policy")
-    TERMS_LINK = (By.LINK_TEXT, "Terms of Service")
-    SUPPORT_LINK = (By.LINK_TEXT, "Support")
-    FAQ_LINK = (By.LINK_TEXT, "FAQ")
+    PRIVACY_LINK = (By.CSS_SELECTOR, "[data-link='privacy'], .privacy-link")
+    TERMS_LINK = (By.CSS_SELECTOR, "[data-link='terms'], .terms-link")
+    SUPPORT_LINK = (By.CSS_SELECTOR, "[data-link='support'], .support-link")
+    FAQ_LINK = (By.CSS_SELECTOR, "[data-link='faq'], .faq-link")
+    
+    # Link-text fallbacks for markup without the data-link/class hooks (a link-text
+    # lookup walks every <a> on the page, so it is only tried when the CSS one misses)
+    LINK_TEXT_FALLBACKS = {
+        PRIVACY_LINK: (By.LINK_TEXT, "Privacy Policy"),
+        TERMS_LINK: (By.LINK_TEXT, "Terms of Service"),
+        SUPPORT_LINK: (By.LINK_TEXT, "Support"),
+        FAQ_LINK: (By.LINK_TEXT, "FAQ"),
+    }
     
     # Social media links
     SOCIAL_LINKS = (By.CSS_SELECTOR, ".social-links")
@@ -229,24 +261,32 @@ class Footer(BasePage):
         super().__init__(driver)
     
     # Navigation methods
+    def _click_link(self, locator: tuple):
+        """Click a footer link by its CSS locator, falling back to its link text when the page lacks the hook"""
+        with self.no_implicit_wait():
+            found = self.driver.find_elements(*locator)
+        if not found:
+            locator = self.LINK_TEXT_FALLBACKS[locator]
+        self.click(locator)
+    
     def click_privacy_policy(self):
         """Click privacy policy link"""
-        self.click(self.PRIVACY_LINK)
+        self._click_link(self.PRIVACY_LINK)
         self.logger.info("Privacy policy link clicked")
     
     def click_terms_of_service(self):
         """Click terms of service link"""
-        self.click(self.TERMS_LINK)
+        self._click_link(self.TERMS_LINK)
         self.logger.info("Terms of service link clicked")
     
     def click_support(self):
         """Click support link"""
-        self.click(self.SUPPORT_LINK)
+        self._click_link(self.SUPPORT_LINK)
         self.logger.info("Support link clicked")
     
     def click_faq(self):
         """Click FAQ link"""
-        self.click(self.FAQ_LINK)
+        self._click_link(self.FAQ_LINK)
         self.logger.info("FAQ link clicked")
     
     # Social media methods
@@ -268,18 +308,11 @@ class Footer(BasePage):
     # Information methods
     def get_copyright_text(self) -> str:
         """Get copyright text from footer"""
-        if self.is_element_present(self.COPYRIGHT_TEXT):
-            return self.get_text(self.COPYRIGHT_TEXT)
-        return ""
+        return self._safe_text(self.COPYRIGHT_TEXT)
     
     def get_footer_links(self) -> List[str]:
         """Get list of footer link texts"""
-        links = []
-        if self.is_element_present(self.FOOTER_LINKS):
-            link_elements = self.find_elements((By.CSS_SELECTOR, f"{self.FOOTER_LINKS[1]} a"))
-            for link in link_elements:
-                links.append(link.text)
-        return links
+        return self._collect_texts(self.FOOTER_LINK_ANCHORS)
     
     # Assertion methods
     def assert_footer_present(self):
@@ -348,20 +381,11 @@ class NavigationMenu(BasePage):
     # Menu state methods
     def get_menu_items(self) -> List[str]:
         """Get list of menu item texts"""
-        items = []
-        menu_elements = self.find_elements(self.MENU_ITEMS)
-        
-        for item in menu_elements:
-            if item.is_displayed():
-                items.append(item.text)
-        
-        return items
+        return self._collect_texts(self.MENU_ITEMS, visible_only=True)
     
     def get_active_menu_item(self) -> str:
         """Get text of currently active menu item"""
-        if self.is_element_present(self.ACTIVE_ITEM):
-            return self.get_text(self.ACTIVE_ITEM)
-        return ""
+        return self._safe_text(self.ACTIVE_ITEM)
     
     def expand_menu_item(self, item_locator: tuple):
         """Expand a collapsible menu item"""
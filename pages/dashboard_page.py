@@ -5,10 +5,103 @@ This module contains the DashboardPage class for handling dashboard functionalit
 """
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import TimeoutException
 from typing import List, Dict, Optional
 
 from core import BasePage, assertion_manager
+from core.base_page import _TEXT_OF_JS
+
+
+# Reads the text of each named CSS selector in one round trip; absent elements map to null
+_READ_TEXTS_SCRIPT = _TEXT_OF_JS + """
+const texts = {};
+for (const [name, selector] of arguments[0]) {
+    const el = document.querySelector(selector);
+    texts[name] = el ? textOf(el) : null;
+}
+return texts;
+"""
+
+# Badge text plus the notification item texts (empty unless the dropdown is in the page)
+_NOTIFICATIONS_SCRIPT = _TEXT_OF_JS + """
+const [badgeSelector, dropdownSelector, itemSelector] = arguments;
+const badge = document.querySelector(badgeSelector);
+const dropdown = document.querySelector(dropdownSelector);
+return {
+    badge: badge ? textOf(badge) : '',
+    items: dropdown ? Array.from(dropdown.querySelectorAll(itemSelector), textOf) : []
+};
+"""
+
+# Sets the search box value, fires input/change, then an Enter keydown/keyup; submits the enclosing
+# form like a real Enter would unless a handler cancelled the keydown. Returns false, without touching
+# the page, if there is no box or its value cannot be set
+_SEARCH_SCRIPT = """
+const [selector, term] = arguments;
+const el = document.querySelector(selector);
+if (!el) return false;
+// the built-in prototype setter keeps framework-controlled inputs (e.g. React) in sync; subclassed
+// inputs have no own value descriptor, so it is taken from HTMLInputElement/HTMLTextAreaElement
+const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+try {
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, term);
+} catch (e) { return false; }
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+const enter = {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true, cancelable: true};
+const proceed = el.dispatchEvent(new KeyboardEvent('keydown', enter));
+el.dispatchEvent(new KeyboardEvent('keyup', enter));
+if (proceed && el.form) el.form.requestSubmit();
+return true;
+"""
+
+# Resolves true once any of the given selectors has non-empty text, or false after the timeout (ms);
+# a MutationObserver re-checks on DOM changes so the browser waits instead of Python polling
+_WAIT_FOR_ANY_TEXT_SCRIPT = _TEXT_OF_JS + """
+const [selectors, timeoutMs, done] = arguments;
+let finished = false;
+const finish = (found) => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(found);
+};
+const check = () => {
+    if (selectors.some(selector => {
+        const el = document.querySelector(selector);
+        return el && textOf(el);
+    })) finish(true);
+};
+const observer = new MutationObserver(check);
+const timer = setTimeout(() => finish(false), timeoutMs);
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+check();
+"""
+
+# Title text of each widget (null when it has none)
+_WIDGET_TITLES_SCRIPT = _TEXT_OF_JS + """
+const [widgetSelector, titleSelector] = arguments;
+return Array.from(document.querySelectorAll(widgetSelector), widget => {
+    const title = widget.querySelector(titleSelector);
+    return title ? textOf(title) : null;
+});
+"""
+
+# Title/time of each activity item that has both, or nothing when the activity list is absent
+_RECENT_ACTIVITIES_SCRIPT = _TEXT_OF_JS + """
+const [listSelector, itemSelector, titleSelector, timeSelector] = arguments;
+if (!document.querySelector(listSelector)) return [];
+const activities = [];
+for (const item of document.querySelectorAll(itemSelector)) {
+    const title = item.querySelector(titleSelector);
+    const time = item.querySelector(timeSelector);
+    if (title && time) activities.push({title: textOf(title), time: textOf(time)});
+}
+return activities;
+"""
 
 
 class DashboardPage(BasePage):
@@ -32,6 +125,7 @@ class DashboardPage(BasePage):
     
     # Dashboard widgets/cards
     DASHBOARD_WIDGETS = (By.CSS_SELECTOR, ".dashboard-widget")
+    WIDGET_TITLE = (By.CSS_SELECTOR, ".widget-title, h3, h4")
     STATS_CARD = (By.CSS_SELECTOR, ".stats-card")
     RECENT_ACTIVITY_CARD = (By.CSS_SELECTOR, ".recent-activity")
     QUICK_ACTIONS_CARD = (By.CSS_SELECTOR, ".quick-actions")
@@ -48,6 +142,16 @@ class DashboardPage(BasePage):
     REVENUE_STAT = (By.CSS_SELECTOR, "[data-stat='revenue']")
     CONVERSION_RATE_STAT = (By.CSS_SELECTOR, "[data-stat='conversion-rate']")
     
+    # Statistic name -> locator, in the order get_dashboard_stats reports them
+    STAT_LOCATORS = {
+        'total_users': TOTAL_USERS_STAT,
+        'active_sessions': ACTIVE_SESSIONS_STAT,
+        'revenue': REVENUE_STAT,
+        'conversion_rate': CONVERSION_RATE_STAT,
+    }
+    # (name, CSS selector) pairs passed to the stats scripts, built once instead of per call
+    STAT_SELECTORS = tuple((name, locator[1]) for name, locator in STAT_LOCATORS.items())
+    
     # Recent activity
     ACTIVITY_LIST = (By.CSS_SELECTOR, ".activity-list")
     ACTIVITY_ITEMS = (By.CSS_SELECTOR, ".activity-item")
@@ -71,30 +175,34 @@ class DashboardPage(BasePage):
     # Navigation methods
     def open_dashboard(self):
         """Navigate to dashboard page"""
+        # open() already waits for readyState and for the dashboard container to be visible
         self.open(self.page_url)
-        self.wait_for_page_load()
         self.logger.info("Dashboard page opened")
     
+    def _open_user_menu(self):
+        """Click the user menu toggle if the page has one (one lookup, no presence pre-check)"""
+        with self.no_implicit_wait():
+            menus = self.driver.find_elements(*self.USER_MENU)
+        if menus:
+            menus[0].click()
+    
     def logout(self):
         """Logout from dashboard"""
-        if self.is_element_present(self.USER_MENU):
-            self.click(self.USER_MENU)
+        self._open_user_menu()
         
         self.click(self.LOGOUT_BUTTON)
         self.logger.info("Logout initiated from dashboard")
     
     def navigate_to_profile(self):
         """Navigate to user profile"""
-        if self.is_element_present(self.USER_MENU):
-            self.click(self.USER_MENU)
+        self._open_user_menu()
         
         self.click(self.PROFILE_LINK)
         self.logger.info("Navigated to profile page")
     
     def navigate_to_settings(self):
         """Navigate to settings page"""
-        if self.is_element_present(self.USER_MENU):
-            self.click(self.USER_MENU)
+        self._open_user_menu()
         
         self.click(self.SETTINGS_LINK)
         self.logger.info("Navigated to settings page")
@@ -106,9 +214,7 @@ class DashboardPage(BasePage):
     
     def get_welcome_message(self) -> str:
         """Get user welcome message"""
-        if self.is_element_present(self.USER_WELCOME_MESSAGE):
-            return self.get_text(self.USER_WELCOME_MESSAGE)
-        return ""
+        return self._safe_text(self.USER_WELCOME_MESSAGE)
     
     def get_username_from_welcome(self) -> str:
         """Extract username from welcome message"""
@@ -123,45 +229,25 @@ class DashboardPage(BasePage):
     # Statistics methods
     def get_dashboard_stats(self) -> Dict[str, str]:
         """Get all dashboard statistics"""
-        stats = {}
-        
-        if self.is_element_present(self.TOTAL_USERS_STAT):
-            stats['total_users'] = self.get_text(self.TOTAL_USERS_STAT)
-        
-        if self.is_element_present(self.ACTIVE_SESSIONS_STAT):
-            stats['active_sessions'] = self.get_text(self.ACTIVE_SESSIONS_STAT)
-        
-        if self.is_element_present(self.REVENUE_STAT):
-            stats['revenue'] = self.get_text(self.REVENUE_STAT)
-        
-        if self.is_element_present(self.CONVERSION_RATE_STAT):
-            stats['conversion_rate'] = self.get_text(self.CONVERSION_RATE_STAT)
-        
-        return stats
+        # One script call reads every stat instead of a presence check and a text fetch per stat
+        texts = self.driver.execute_script(_READ_TEXTS_SCRIPT, self.STAT_SELECTORS)
+        return {name: texts[name] for name in self.STAT_LOCATORS if texts.get(name) is not None}
     
     def get_total_users(self) -> str:
         """Get total users statistic"""
-        if self.is_element_present(self.TOTAL_USERS_STAT):
-            return self.get_text(self.TOTAL_USERS_STAT)
-        return "0"
+        return self.get_dashboard_stats().get('total_users', "0")
     
     def get_active_sessions(self) -> str:
         """Get active sessions statistic"""
-        if self.is_element_present(self.ACTIVE_SESSIONS_STAT):
-            return self.get_text(self.ACTIVE_SESSIONS_STAT)
-        return "0"
+        return self.get_dashboard_stats().get('active_sessions', "0")
     
     def get_revenue(self) -> str:
         """Get revenue statistic"""
-        if self.is_element_present(self.REVENUE_STAT):
-            return self.get_text(self.REVENUE_STAT)
-        return "$0"
+        return self.get_dashboard_stats().get('revenue', "$0")
     
     def get_conversion_rate(self) -> str:
         """Get conversion rate statistic"""
-        if self.is_element_present(self.CONVERSION_RATE_STAT):
-            return self.get_text(self.CONVERSION_RATE_STAT)
-        return "0%"
+        return self.get_dashboard_stats().get('conversion_rate', "0%")
     
     # Widget and card methods
     def get_widget_count(self) -> int:
@@ -175,17 +261,8 @@ class DashboardPage(BasePage):
     
     def get_widget_titles(self) -> List[str]:
         """Get titles of all dashboard widgets"""
-        titles = []
-        widgets = self.find_elements(self.DASHBOARD_WIDGETS)
-        
-        for widget in widgets:
-            try:
-                title_element = widget.find_element(By.CSS_SELECTOR, ".widget-title, h3, h4")
-                titles.append(title_element.text)
-            except:
-                titles.append("Untitled Widget")
-        
-        return titles
+        titles = self.driver.execute_script(_WIDGET_TITLES_SCRIPT, self.DASHBOARD_WIDGETS[1], self.WIDGET_TITLE[1])
+        return [title if title is not None else "Untitled Widget" for title in titles]
     
     # Quick actions methods
     def click_create_new(self):
@@ -211,26 +288,11 @@ class DashboardPage(BasePage):
     # Activity methods
     def get_recent_activities(self) -> List[Dict[str, str]]:
         """Get list of recent activities"""
-        activities = []
-        
-        if not self.is_element_present(self.ACTIVITY_LIST):
-            return activities
-        
-        activity_items = self.find_elements(self.ACTIVITY_ITEMS)
-        
-        for item in activity_items:
-            try:
-                title = item.find_element(By.CSS_SELECTOR, ".activity-title").text
-                time = item.find_element(By.CSS_SELECTOR, ".activity-time").text
-                
-                activities.append({
-                    'title': title,
-                    'time': time
-                })
-            except:
-                continue
-        
-        return activities
+        # One script call instead of a findElement + getText per field of every item
+        return self.driver.execute_script(
+            _RECENT_ACTIVITIES_SCRIPT, self.ACTIVITY_LIST[1], self.ACTIVITY_ITEMS[1],
+            self.ACTIVITY_ITEM_TITLE[1], self.ACTIVITY_ITEM_TIME[1]
+        )
     
     def get_activity_count(self) -> int:
         """Get count of recent activity items"""
@@ -240,13 +302,7 @@ class DashboardPage(BasePage):
     # Notification methods
     def get_notification_count(self) -> int:
         """Get notification count from badge"""
-        if self.is_element_present(self.NOTIFICATION_BADGE):
-            badge_text = self.get_text(self.NOTIFICATION_BADGE)
-            try:
-                return int(badge_text)
-            except ValueError:
-                return 0
-        return 0
+        return self.fetch_notifications()['count']
     
     def click_notifications(self):
         """Click notifications to open dropdown"""
@@ -255,20 +311,27 @@ class DashboardPage(BasePage):
     
     def get_notifications(self) -> List[str]:
         """Get list of notification texts"""
-        notifications = []
-        
-        if self.is_element_present(self.NOTIFICATION_DROPDOWN):
-            notification_items = self.find_elements(self.NOTIFICATION_ITEMS)
-            for item in notification_items:
-                notifications.append(item.text)
-        
-        return notifications
+        return self.fetch_notifications()['items']
+    
+    def fetch_notifications(self) -> Dict[str, object]:
+        """Get badge count and notification texts with one script call, as {'count': int, 'items': List[str]}"""
+        result = self.driver.execute_script(
+            _NOTIFICATIONS_SCRIPT, self.NOTIFICATION_BADGE[1], self.NOTIFICATION_DROPDOWN[1], self.NOTIFICATION_ITEMS[1]
+        )
+        try:
+            count = int(result['badge'])
+        except ValueError:
+            count = 0
+        return {'count': count, 'items': result['items']}
     
     # Search and filter methods
-    def search(self, search_term: str):
-        """Perform search on dashboard"""
-        self.type(self.SEARCH_INPUT, search_term)
-        self.press_key(self.SEARCH_INPUT, Keys.ENTER)
+    def search(self, search_term: str, js_submit: bool = False):
+        """Perform search on dashboard; js_submit sets the term and fires a synthetic Enter in one script call"""
+        # The script's events are untrusted and it sends no keypress, so it is only for search boxes
+        # known to react to input/keydown or form submission
+        if not js_submit or not self.driver.execute_script(_SEARCH_SCRIPT, self.SEARCH_INPUT[1], search_term):
+            self.type(self.SEARCH_INPUT, search_term)
+            self.press_key(self.SEARCH_INPUT, Keys.ENTER)
         self.logger.info(f"Searched for: {search_term}")
     
     def clear_search(self):
@@ -278,27 +341,28 @@ class DashboardPage(BasePage):
     
     def select_filter(self, filter_value: str):
         """Select filter from dropdown"""
-        self.click(self.FILTER_DROPDOWN)
-        filter_option = (By.XPATH, f"//option[text()='{filter_value}']")
-        self.click(filter_option)
+        # Scoped option lookup on the <select> itself instead of a document-wide XPath built from the value
+        self.select_by_visible_text(self.FILTER_DROPDOWN, filter_value)
         self.logger.info(f"Filter selected: {filter_value}")
     
     # Validation and assertion methods
     def assert_dashboard_loaded(self):
         """Assert that dashboard page is properly loaded"""
+        # All three facts come from one probe instead of a round trip each
+        container, title, widgets = self._probe(self.DASHBOARD_CONTAINER, self.PAGE_TITLE, self.DASHBOARD_WIDGETS)
         assertion_manager.assert_true(
-            self.is_element_present(self.DASHBOARD_CONTAINER),
+            container['present'],
             "Dashboard container should be present"
         )
         
         assertion_manager.assert_true(
-            self.is_element_present(self.PAGE_TITLE),
+            title['present'],
             "Page title should be present"
         )
         
         # Check that essential widgets are present
         assertion_manager.assert_true(
-            self.get_widget_count() > 0,
+            widgets['count'] > 0,
             "At least one dashboard widget should be present"
         )
     
@@ -357,25 +421,37 @@ class DashboardPage(BasePage):
     # Utility methods
     def wait_for_stats_to_load(self, timeout: int = 10):
         """Wait for dashboard statistics to load"""
-        # Wait for at least one stat element to have non-empty text
-        from selenium.webdriver.support.ui import WebDriverWait
-        
-        def stats_loaded(driver):
-            stats = self.get_dashboard_stats()
-            return len(stats) > 0 and any(value.strip() for value in stats.values())
-        
+        # Wait for at least one stat element to have non-empty text, in one async script call
+        # rather than re-reading the stats every poll; the driver timeout gets a second of slack
+        # so the in-page timer normally ends the wait. The previous script timeout is restored,
+        # since callers such as WebActions remember the value they last set
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout + 1)
         try:
-            WebDriverWait(self.driver, timeout).until(stats_loaded)
+            loaded = self.driver.execute_async_script(
+                _WAIT_FOR_ANY_TEXT_SCRIPT, [selector for _, selector in self.STAT_SELECTORS], timeout * 1000
+            )
+        except TimeoutException:
+            loaded = False
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+        
+        if loaded:
             self.logger.info("Dashboard statistics loaded")
-        except:
+        else:
             self.logger.warning("Dashboard statistics load timeout")
     
     def refresh_dashboard(self):
-        """Refresh dashboard page"""
+        """Refresh dashboard page, waiting only for the dashboard container (see refresh_and_wait_for_stats)"""
+        # refresh() waits for readyState and the container (page_load_element) to be visible
         self.refresh()
-        self.wait_for_stats_to_load()
         self.logger.info("Dashboard refreshed")
     
+    def refresh_and_wait_for_stats(self, timeout: int = 10):
+        """Refresh dashboard page and wait for its statistics to load"""
+        self.refresh_dashboard()
+        self.wait_for_stats_to_load(timeout)
+    
     def take_dashboard_screenshot(self, filename: str = None) -> str:
         """Take screenshot of dashboard"""
         if not filename:
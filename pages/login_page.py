@@ -6,11 +6,19 @@ This module contains the LoginPage class for handling login functionality
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from typing import Optional
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from typing import Callable, Dict, Optional
 
 from core import BasePage, assertion_manager
 
 
+def _is_attached(element: WebElement) -> bool:
+    """Touch the element; any call raises StaleElementReferenceException once it left the DOM"""
+    element.is_enabled()
+    return True
+
+
 class LoginPage(BasePage):
     """Login page object with login functionality"""
     
@@ -39,13 +47,77 @@ class LoginPage(BasePage):
     def __init__(self, driver: WebDriver = None):
         super().__init__(driver)
         self.page_load_element = self.LOGIN_FORM
+        # Elements found on the current login page, reused until they go stale or the page changes
+        self._element_cache: Dict[tuple, WebElement] = {}
+    
+    # Element cache: the same few locators are looked up many times per login
+    def _cached_element(self, locator: tuple, check: Callable[[WebElement], bool]) -> Optional[WebElement]:
+        """Return the cached element if check() still passes on it; one call both re-validates and tests it"""
+        element = self._element_cache.get(locator)
+        if element is not None:
+            try:
+                if check(element):
+                    return element
+            except StaleElementReferenceException:
+                del self._element_cache[locator]
+        return None
+    
+    def _invalidate_cache(self):
+        """Forget cached elements (after anything that may replace the page)"""
+        self._element_cache.clear()
+    
+    def find_element(self, locator: tuple, timeout: int = None) -> WebElement:
+        """Find element with explicit wait, reusing the cached element while it is attached"""
+        element = self._cached_element(locator, _is_attached)
+        if element is None:
+            element = self._element_cache[locator] = super().find_element(locator, timeout)
+        return element
+    
+    def find_visible_element(self, locator: tuple, timeout: int = None) -> WebElement:
+        """Find visible element with explicit wait, reusing the cached element while it is displayed"""
+        element = self._cached_element(locator, lambda el: el.is_displayed())
+        if element is None:
+            element = self._element_cache[locator] = super().find_visible_element(locator, timeout)
+        return element
+    
+    def find_clickable_element(self, locator: tuple, timeout: int = None) -> WebElement:
+        """Find clickable element with explicit wait, reusing the cached element while it is clickable"""
+        element = self._cached_element(locator, lambda el: el.is_displayed() and el.is_enabled())
+        if element is None:
+            element = self._element_cache[locator] = super().find_clickable_element(locator, timeout)
+        return element
+    
+    def is_element_present(self, locator: tuple) -> bool:
+        """Check if element is present in DOM, remembering it for later lookups"""
+        if self._cached_element(locator, _is_attached) is not None:
+            return True
+        try:
+            self._element_cache[locator] = self.driver.find_element(*locator)
+            return True
+        except NoSuchElementException:
+            return False
     
     # Navigation methods
-    def open_login_page(self):
-        """Navigate to login page"""
+    def open_login_page(self, current_url: str = None) -> bool:
+        """
+        Navigate to login page
+        
+        Args:
+            current_url: URL the caller already knows the browser is on; navigation is
+                skipped when it is the login page, saving a page load
+        
+        Returns:
+            bool: True if the login page was (re)loaded, False if it was already open
+        """
+        if current_url is not None and self.page_url in current_url.lower():
+            self.logger.info("Login page already open")
+            return False
+        
+        # open() already waits for readyState and for the login form to be visible
         self.open(self.page_url)
-        self.wait_for_page_load()
+        self._invalidate_cache()
         self.logger.info("Login page opened")
+        return True
     
     # Input methods
     def enter_username(self, username: str):
@@ -72,6 +144,8 @@ class LoginPage(BasePage):
     def click_login_button(self):
         """Click the login button"""
         self.click(self.LOGIN_BUTTON)
+        # submitting replaces or rewrites the page; cached fields must be looked up again
+        self._invalidate_cache()
         self.logger.info("Login button clicked")
     
     def click_forgot_password(self):
@@ -204,27 +278,19 @@ class LoginPage(BasePage):
     
     def get_error_message(self) -> str:
         """Get error message text if present"""
-        if self.is_element_present(self.ERROR_MESSAGE):
-            return self.get_text(self.ERROR_MESSAGE)
-        return ""
+        return self._safe_text(self.ERROR_MESSAGE)
     
     def get_success_message(self) -> str:
         """Get success message text if present"""
-        if self.is_element_present(self.SUCCESS_MESSAGE):
-            return self.get_text(self.SUCCESS_MESSAGE)
-        return ""
+        return self._safe_text(self.SUCCESS_MESSAGE)
     
     def get_username_error(self) -> str:
         """Get username field validation error"""
-        if self.is_element_present(self.USERNAME_ERROR):
-            return self.get_text(self.USERNAME_ERROR)
-        return ""
+        return self._safe_text(self.USERNAME_ERROR)
     
     def get_password_error(self) -> str:
         """Get password field validation error"""
-        if self.is_element_present(self.PASSWORD_ERROR):
-            return self.get_text(self.PASSWORD_ERROR)
-        return ""
+        return self._safe_text(self.PASSWORD_ERROR)
     
     def is_username_field_highlighted(self) -> bool:
         """Check if username field has error highlighting"""
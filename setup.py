@@ -5,6 +5,7 @@ This file enables installation of the framework as a package
 and defines project metadata and dependencies.
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -19,6 +20,13 @@ if requirements_file.exists():
     with open(requirements_file, 'r') as f:
         requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
 
+# Optionally compile the assertion keyword layer with Cython (requires Cython at build time)
+# Enable with PYTESTSUITE_CYTHONIZE=1
+ext_modules = []
+if os.getenv('PYTESTSUITE_CYTHONIZE') == '1':
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["keywords/assertion_keywords.py"], language_level=3)
+
 setup(
     name="pytestsuite-pro",
     version="1.0.0",
@@ -35,6 +43,7 @@ setup(
     },
     
     packages=find_packages(),
+    ext_modules=ext_modules,
     
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -68,6 +77,21 @@ setup(
         "excel": [
             "openpyxl>=3.1.0",
         ],
+        "http2": [
+            "httpx[http2]>=0.25.0",
+        ],
+        "brotli": [
+            "brotli>=1.1.0",
+        ],
+        "ahocorasick": [
+            "pyahocorasick>=2.0.0",
+        ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
+        "arrow": [
+            "pyarrow>=11.0.0",
+        ],
     },
     
     entry_points={
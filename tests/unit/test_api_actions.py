@@ -0,0 +1,101 @@
+"""
+API Actions Tests for PyTestSuite Pro
+
+This module contains unit tests for keywords.api_actions.
+They run without network access.
+"""
+
+import json
+
+import pytest
+import requests
+
+from keywords.api_actions import APIActions, _parse_json_path, _walk_json_path, _MISSING
+
+
+def _json_response(data) -> requests.Response:
+    """Build a requests.Response carrying data as its JSON body"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = 'application/json'
+    response._content = json.dumps(data).encode()
+    return response
+
+
+@pytest.mark.fast
+class TestJsonPath:
+    """Simplified dot-notation JSON paths"""
+    
+    DATA = {
+        "user": {"name": "Ada", "roles": ["admin", "dev"]},
+        "items": [{"id": 1}, {"id": 2}],
+        "0": "string key",
+    }
+    
+    def test_parse_splits_keys_and_indices(self):
+        assert _parse_json_path("items.1.id") == ("items", 1, "id")
+        assert _parse_json_path("user.name") == ("user", "name")
+    
+    def test_walk_resolves_nested_keys(self):
+        assert _walk_json_path(self.DATA, _parse_json_path("user.name")) == "Ada"
+    
+    def test_walk_resolves_list_indices(self):
+        assert _walk_json_path(self.DATA, _parse_json_path("items.1.id")) == 2
+        assert _walk_json_path(self.DATA, _parse_json_path("user.roles.0")) == "admin"
+    
+    @pytest.mark.parametrize("path", [
+        "missing",
+        "user.missing",
+        "items.5.id",
+        "items.x",
+        "user.name.first",
+    ])
+    def test_walk_returns_missing_marker(self, path):
+        assert _walk_json_path(self.DATA, _parse_json_path(path)) is _MISSING
+    
+    def test_digit_path_part_is_an_index_not_a_key(self):
+        # dict keys are looked up as parsed, so a numeric segment does not match a string key
+        assert _walk_json_path(self.DATA, _parse_json_path("0")) is _MISSING
+    
+    def test_json_contains_key_resolves_paths(self):
+        response = _json_response(self.DATA)
+        actions = APIActions()
+        
+        assert actions.json_contains_key("items.0.id", response)
+        assert not actions.json_contains_key("items.2.id", response)
+        assert not actions.json_contains_key("user.email", response)
+
+
+@pytest.mark.fast
+class TestSessionIsolation:
+    """Per-instance sessions over shared connection pools"""
+    
+    def test_instances_share_pool_but_not_cookies(self):
+        first, second = APIActions(), APIActions()
+        try:
+            assert first.session is not second.session
+            url = f"{first.base_url}/get"
+            assert first.session.get_adapter(url) is second.session.get_adapter(url)
+            
+            first.session.cookies.set("token", "secret")
+            assert "token" not in second.session.cookies
+        finally:
+            first.close_session()
+            second.close_session()
+    
+    def test_close_session_clears_cookies(self):
+        actions = APIActions()
+        session = actions.session
+        session.cookies.set("token", "secret")
+        actions.close_session()
+        
+        assert len(session.cookies) == 0
+        assert actions.session is not session
+    
+    def test_headers_are_per_instance(self):
+        first, second = APIActions(), APIActions()
+        first.set_header("Authorization", "Bearer first")
+        
+        assert first._merge_headers(None)["Authorization"] == "Bearer first"
+        assert second._merge_headers(None) is None
+        assert "Authorization" not in first.session.headers
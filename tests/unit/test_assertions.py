@@ -0,0 +1,75 @@
+"""
+Assertion Manager Tests for PyTestSuite Pro
+
+This module contains unit tests for AssertionManager level handling and deferred messages.
+"""
+
+import logging
+
+import pytest
+
+from core.assertions import AssertionManager, AssertionLevel
+
+
+@pytest.mark.fast
+class TestAssertionLevels:
+    """Level coercion in AssertionManager"""
+    
+    @pytest.mark.parametrize("level", [AssertionLevel.HARD, 1, "HARD", "hard"])
+    def test_hard_levels_fail_the_test(self, level):
+        manager = AssertionManager()
+        with pytest.raises(pytest.fail.Exception):
+            manager.assert_equals(1, 2, "x", level=level)
+    
+    @pytest.mark.parametrize("level", [AssertionLevel.SOFT, 2, "SOFT"])
+    def test_soft_levels_are_collected(self, level):
+        manager = AssertionManager()
+        manager.assert_equals(1, 2, "x", level=level)
+        
+        assert [result.level for result in manager.results] == [AssertionLevel.SOFT]
+        assert len(manager.get_summary().soft_failures) == 1
+    
+    @pytest.mark.parametrize("level", [AssertionLevel.WARNING, 3, "WARNING"])
+    def test_warning_levels_only_log(self, level):
+        manager = AssertionManager()
+        manager.assert_true(False, "x", level=level)
+        
+        assert manager.get_summary().warnings == 1
+    
+    @pytest.mark.parametrize("level", [0, 4, "FATAL", None])
+    def test_unknown_levels_raise_value_error(self, level):
+        manager = AssertionManager()
+        with pytest.raises(ValueError):
+            manager.assert_equals(1, 1, "x", level=level)
+        assert manager.results == []
+
+
+@pytest.mark.fast
+class TestDeferredMessages:
+    """Messages passed as callables"""
+    
+    def test_passed_result_exposes_message_string(self):
+        manager = AssertionManager()
+        calls = []
+        
+        def message():
+            calls.append(1)
+            return "built"
+        
+        manager.logger.setLevel(logging.WARNING)
+        try:
+            manager.soft_assert(True, message)
+        finally:
+            manager.logger.setLevel(logging.INFO)
+        
+        assert calls == []
+        result = manager.results[0]
+        assert result.message == "built"
+        assert result.message == "built"
+        assert calls == [1]
+    
+    def test_failed_result_builds_message(self):
+        manager = AssertionManager()
+        manager.soft_assert(False, lambda: "failed check")
+        
+        assert manager.results[0].message == "failed check"
@@ -0,0 +1,131 @@
+"""
+Data Actions Tests for PyTestSuite Pro
+
+This module contains unit tests for DataActions file handling and caching.
+Each test works in its own temporary test_data directory.
+"""
+
+import json
+
+import pytest
+
+from config import env_manager
+from keywords.data_actions import DataActions, _LRUCache
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Run the test from a temporary directory holding an empty test_data tree"""
+    for sub_dir in ("json", "csv", "yaml"):
+        (tmp_path / "test_data" / sub_dir).mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "test_data"
+
+
+@pytest.mark.fast
+class TestEnvironmentData:
+    """Environment data snapshot"""
+    
+    def test_mutating_returned_value_does_not_leak(self, data_dir):
+        env_file = data_dir / "json" / f"environment_{env_manager.current_env}.json"
+        env_file.write_text(json.dumps({"users": [{"name": "Ada"}]}))
+        
+        first = DataActions()
+        users = first.get_environment_data("users")
+        users.append({"name": "Mallory"})
+        users[0]["name"] = "changed"
+        
+        assert first.get_environment_data("users") == [{"name": "Ada"}]
+        assert DataActions().get_environment_data("users") == [{"name": "Ada"}]
+
+
+@pytest.mark.fast
+class TestAppendDataToCsv:
+    """Appending records through the kept-open handle"""
+    
+    def test_header_written_once_across_instances(self, data_dir):
+        first, second = DataActions(), DataActions()
+        try:
+            first.append_data_to_csv({"a": 1, "b": 2}, "rows.csv")
+            second.append_data_to_csv({"a": 3, "b": 4}, "rows.csv")
+        finally:
+            first.close_csv_appender()
+            second.close_csv_appender()
+        
+        assert (data_dir / "csv" / "rows.csv").read_text() == "a,b\n1,2\n3,4\n"
+    
+    def test_records_with_different_keys(self, data_dir):
+        actions = DataActions()
+        try:
+            actions.append_data_to_csv({"a": 1, "b": 2}, "rows.csv")
+            actions.append_data_to_csv({"a": 3, "b": 4, "c": 5}, "rows.csv")
+            actions.append_data_to_csv({"b": 6}, "rows.csv")
+        finally:
+            actions.close_csv_appender()
+        
+        assert (data_dir / "csv" / "rows.csv").read_text() == "a,b\n1,2\n3,4,5\n6\n"
+    
+    def test_load_sees_buffered_rows(self, data_dir):
+        actions = DataActions()
+        try:
+            actions.append_data_to_csv({"a": "1"}, "rows.csv")
+            actions.append_data_to_csv({"a": "2"}, "rows.csv")
+            
+            assert actions.load_csv_data("rows.csv") == [{"a": "1"}, {"a": "2"}]
+        finally:
+            actions.close_csv_appender()
+
+
+@pytest.mark.fast
+class TestLRUCache:
+    """Least recently used eviction behind DataActions.cached_data"""
+    
+    def test_evicts_oldest_entry_beyond_maxsize(self):
+        evicted = []
+        cache = _LRUCache(2, on_evict=evicted.append)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        
+        assert list(cache) == ["b", "c"]
+        assert evicted == ["a"]
+    
+    def test_read_marks_entry_as_recently_used(self):
+        evicted = []
+        cache = _LRUCache(2, on_evict=evicted.append)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        
+        assert list(cache) == ["a", "c"]
+        assert evicted == ["b"]
+    
+    def test_overwrite_marks_entry_as_recently_used(self):
+        cache = _LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+        cache["c"] = 3
+        
+        assert dict(cache.items()) == {"a": 10, "c": 3}
+    
+    def test_membership_and_views_do_not_reorder(self):
+        cache = _LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert "a" in cache
+        list(cache.items())
+        list(cache.values())
+        cache["c"] = 3
+        
+        assert list(cache) == ["b", "c"]
+    
+    def test_limit_comes_from_environment(self, monkeypatch):
+        monkeypatch.setenv("PTS_CACHE_ENTRIES", "3")
+        actions = DataActions()
+        for key in "abcd":
+            actions.cache_data(key, [key])
+        
+        assert actions.cached_data.maxsize == 3
+        assert list(actions.cached_data) == ["b", "c", "d"]
@@ -0,0 +1,64 @@
+"""
+Web Actions Helper Tests for PyTestSuite Pro
+
+This module contains unit tests for the locator helpers in keywords.web_actions.
+They run without a browser.
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from keywords.web_actions import _to_css, _prepare_locator
+
+
+@pytest.mark.fast
+class TestToCss:
+    """Locator to CSS selector translation"""
+    
+    def test_css_selector_passes_through(self):
+        assert _to_css((By.CSS_SELECTOR, "form > .error")) == "form > .error"
+    
+    def test_id_and_name_become_attribute_selectors(self):
+        assert _to_css((By.ID, "username")) == '[id="username"]'
+        assert _to_css((By.NAME, "email")) == '[name="email"]'
+    
+    @pytest.mark.parametrize("value, expected", [
+        ('say "hi"', '[id="say \\"hi\\""]'),
+        ("it's", '[id="it\'s"]'),
+        ("back\\slash", '[id="back\\\\slash"]'),
+        ('\\"', '[id="\\\\\\""]'),
+        ("two\nlines", '[id="two\\a lines"]'),
+    ])
+    def test_quotes_and_backslashes_are_escaped(self, value, expected):
+        assert _to_css((By.ID, value)) == expected
+    
+    def test_single_class_name_only(self):
+        assert _to_css((By.CLASS_NAME, "btn")) == '[class~="btn"]'
+        assert _to_css((By.CLASS_NAME, "btn primary")) is None
+    
+    def test_tag_name(self):
+        assert _to_css((By.TAG_NAME, "input")) == "input"
+        assert _to_css((By.TAG_NAME, "div > a")) is None
+    
+    def test_strategies_without_css_equivalent(self):
+        assert _to_css((By.XPATH, "//a")) is None
+        assert _to_css((By.LINK_TEXT, "Home")) is None
+
+
+@pytest.mark.fast
+class TestPrepareLocator:
+    """Locator validation for the batched JS helpers"""
+    
+    def test_translates_to_css(self):
+        assert _prepare_locator((By.ID, "username")) == (By.CSS_SELECTOR, '[id="username"]')
+    
+    def test_keeps_locators_without_css_equivalent(self):
+        assert _prepare_locator((By.XPATH, "//a")) == (By.XPATH, "//a")
+    
+    def test_accepts_list_locators(self):
+        assert _prepare_locator(["id", "username"]) == (By.CSS_SELECTOR, '[id="username"]')
+    
+    @pytest.mark.parametrize("locator", [("bogus", "x"), ("id",), ("id", "a", "b")])
+    def test_rejects_unsupported_locators(self, locator):
+        with pytest.raises(ValueError):
+            _prepare_locator(locator)